@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark the XML condensing stage of pack_document on a synthetic package.
+
+Builds an unpacked .docx with many header parts (500 by default) in a temporary
+directory, packs it with different worker counts, checks that every archive is
+byte-identical to the serial one and prints the timings.
+
+Example usage:
+    python bench_pack.py
+    python bench_pack.py --parts 500 --paragraphs 300 --workers 1 2 4 --repeat 3
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ooxml.scripts.pack import pack_document  # noqa: E402
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+HEADER_TYPE = R_NS + "/header"
+HEADER_CONTENT_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pack_document workers")
+    parser.add_argument("--parts", type=int, default=500, help="Header parts")
+    parser.add_argument(
+        "--paragraphs", type=int, default=300, help="Paragraphs per header part"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4],
+        help="Worker counts to compare; the default (None) is always included",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per worker count")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        unpacked = Path(temp_dir) / "unpacked"
+        build_package(unpacked, args.parts, args.paragraphs)
+        xml_size = sum(f.stat().st_size for f in unpacked.rglob("*.xml"))
+        print(f"{args.parts + 1} XML parts, {xml_size / 1e6:.1f} MB of XML")
+
+        baseline = None
+        for workers in [1, *[w for w in args.workers if w != 1], None]:
+            output_file = Path(temp_dir) / f"packed-{workers}.docx"
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                pack_document(unpacked, output_file, workers=workers)
+                timings.append(time.perf_counter() - start)
+            content = output_file.read_bytes()
+            if baseline is None:
+                baseline = content
+            identical = "identical" if content == baseline else "DIFFERENT"
+            print(f"workers={workers}: best {min(timings):.2f}s ({identical})")
+
+
+def build_package(unpacked, parts, paragraphs):
+    """Write an unpacked .docx with a body and the given number of header parts."""
+    body = "".join(
+        f'\n  <w:p>\n    <w:r>\n      <w:t xml:space="preserve"> Text {i} </w:t>'
+        "\n    </w:r>\n  </w:p>"
+        for i in range(paragraphs)
+    )
+    header_names = [f"header{i + 1}.xml" for i in range(parts)]
+
+    files = {
+        "[Content_Types].xml": (
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'content-types">\n'
+            '  <Default Extension="rels" ContentType="application/'
+            'vnd.openxmlformats-package.relationships+xml"/>\n'
+            '  <Default Extension="xml" ContentType="application/xml"/>\n'
+            '  <Override PartName="/word/document.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>\n'
+            + "".join(
+                f'  <Override PartName="/word/{name}" '
+                f'ContentType="{HEADER_CONTENT_TYPE}"/>\n'
+                for name in header_names
+            )
+            + "</Types>\n"
+        ),
+        "_rels/.rels": (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships">\n'
+            f'  <Relationship Id="rId1" Type="{R_NS}/officeDocument" '
+            'Target="word/document.xml"/>\n'
+            "</Relationships>\n"
+        ),
+        "word/_rels/document.xml.rels": (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+            'relationships">\n'
+            + "".join(
+                f'  <Relationship Id="rId{i + 1}" Type="{HEADER_TYPE}" '
+                f'Target="{name}"/>\n'
+                for i, name in enumerate(header_names)
+            )
+            + "</Relationships>\n"
+        ),
+        "word/document.xml": (
+            f'<w:document xmlns:w="{W_NS}">\n<w:body>{body}\n</w:body>\n'
+            "</w:document>\n"
+        ),
+    }
+    for name in header_names:
+        files[f"word/{name}"] = f'<w:hdr xmlns:w="{W_NS}">{body}\n</w:hdr>\n'
+
+    for name, content in files.items():
+        path = unpacked / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + content,
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    main()
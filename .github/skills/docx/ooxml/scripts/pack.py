@@ -3,29 +3,128 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--workers N] [--level N]
+    python pack.py <input_directory> <office_file> --original <unpacked_office_file>
 """
 
 import argparse
+import atexit
+import collections
+import copy
+import io
+import json
+import os
+import posixpath
+import queue
 import shutil
+import socket
+import struct
 import subprocess
 import sys
 import tempfile
-import defusedxml.minidom
+import threading
+import time
+import xml.sax.handler
+import urllib.parse
+import zlib
+import defusedxml.ElementTree
+import defusedxml.sax
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+try:
+    from .xmlwriter import escape, is_namespace_declaration
+except ImportError:
+    # Run as a script rather than imported from the ooxml.scripts package
+    from xmlwriter import escape, is_namespace_declaration
+
+# Parts condensed when packing
+XML_SUFFIXES = (".xml", ".rels")
+
+# Media that is already compressed, stored as it is instead of deflated again
+STORED_SUFFIXES = {
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".emz",
+    ".wmz",
+    ".wdp",
+    ".mp3",
+    ".m4a",
+    ".mp4",
+    ".wma",
+    ".wmv",
+    ".zip",
+    ".docx",
+    ".xlsx",
+    ".pptx",
+}
+
+# Entry timestamp and permissions, fixed so that packing is reproducible
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_EXTERNAL_ATTR = 0o100644 << 16
+
+# ZipFile internals that copy_zip_entry writes raw entries through
+_RAW_COPY_ATTRIBUTES = ("fp", "filelist", "NameToInfo", "start_dir", "_didModify")
+
+# Deflate level for XML and other compressible parts (zlib's default)
+DEFAULT_COMPRESSLEVEL = 6
+
+# Total XML size below which per-part stages run in this process by default, as
+# starting a process pool would cost more than it saves
+PARALLEL_MIN_BYTES = 1024 * 1024
+
+# soffice --convert-to targets used to validate each kind of Office file
+HTML_FILTERS = {
+    ".docx": "html:HTML",
+    ".pptx": "html:impress_html_Export",
+    ".xlsx": "html:HTML (StarCalc)",
+}
+
+# Seconds a single validation may take
+VALIDATION_TIMEOUT = 10
+
+# File written by unpack.py at the top of the unpacked directory; not a part
+MANIFEST_NAME = ".unpack-manifest.json"
+
+RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to condense XML (default: one per CPU for packages "
+        "with at least 1 MB of XML, otherwise 1)",
+    )
+    parser.add_argument(
+        "--level",
+        type=int,
+        default=DEFAULT_COMPRESSLEVEL,
+        help=f"Deflate level 0-9 for XML parts (default: {DEFAULT_COMPRESSLEVEL})",
+    )
+    parser.add_argument(
+        "--original",
+        help="Office file the directory was unpacked from (unchanged parts are "
+        "copied from it)",
+    )
     args = parser.parse_args()
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            workers=args.workers,
+            compresslevel=args.level,
+            original=args.original,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +141,37 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(
+    input_dir,
+    output_file,
+    validate=False,
+    workers=None,
+    compresslevel=DEFAULT_COMPRESSLEVEL,
+    original=None,
+    soffice_pool=None,
+):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    The archive is reproducible: [Content_Types].xml comes first, the other parts
+    follow sorted by name, and every entry has the same timestamp. Already
+    compressed media is stored, everything else is deflated at compresslevel.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        workers: Number of processes used to condense XML parts. None uses one per
+            CPU if the parts add up to PARALLEL_MIN_BYTES and 1 otherwise; 1
+            condenses them serially. The output is the same either way.
+        compresslevel: Deflate level 0-9 for XML and other compressible parts
+            (default: 6)
+        original: Optional Office file that input_dir was unpacked from. Parts that
+            are unchanged since unpack.py wrote them are copied from it as
+            compressed bytes, without being condensed or deflated again. Parts
+            that unpacking left in the archive are always copied from it; for
+            those, the original recorded in the manifest is used by default.
+        soffice_pool: Optional SofficePool to validate with, e.g. the shared one
+            from get_soffice_pool(). None starts a one-off soffice process.
 
     Returns:
         bool: True if successful, False if validation failed
@@ -60,43 +183,111 @@ def pack_document(input_dir, output_file, validate=False):
         raise ValueError(f"{input_dir} is not a directory")
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if not 0 <= compresslevel <= 9:
+        raise ValueError(f"compresslevel must be between 0 and 9, got {compresslevel}")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
+    # Parts are condensed straight into the archive, so nothing is copied on disk
+    part_files = {
+        f.relative_to(input_dir).as_posix(): f for f in iter_part_files(input_dir)
+    }
+
+    # Parts that unpacking left in the original archive (unpack.py --xml-only)
+    manifest = read_manifest(input_dir)
+    if manifest is None:
+        # Office tolerates dangling relationships, but parts left in an archive
+        # that is no longer known are lost
+        missing = _find_missing_targets(input_dir, part_files)
+        if missing:
+            print(
+                f"Warning: {input_dir} has no {MANIFEST_NAME}, and parts referenced "
+                f"by its relationships are missing: {', '.join(missing[:5])}. If it "
+                f"was unpacked with --xml-only or --parts, unpack it again.",
+                file=sys.stderr,
+            )
+        manifest = {}
+    archived = [name for name in manifest.get("archived", []) if name not in part_files]
+    if archived and original is None:
+        original = manifest["original"]
+    if original is not None and not zipfile.is_zipfile(original):
+        raise ValueError(f"{original} is not an Office file")
+    entry_names = sorted([*part_files, *archived], key=_part_order)
 
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
+    source_zip = zipfile.ZipFile(original) if original else None
+    try:
+        unchanged = (
+            _find_unchanged_parts(input_dir, part_files.values(), source_zip)
+            if source_zip is not None
+            else {}
+        )
+        # Condensed in archive order, so each part is written as soon as it is done
+        condensed = condense_xml_parts(
+            [
+                part_files[name]
+                for name in entry_names
+                if name in part_files
+                and name.endswith(XML_SUFFIXES)
+                and part_files[name] not in unchanged
+            ],
+            workers,
+        )
 
-        # Create final Office file as zip archive
+        # Create final Office file as zip archive, next to the target so that
+        # the original can be overwritten
         output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+        temp_file = output_file.with_name(f".{output_file.name}.tmp")
+        try:
+            with zipfile.ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED) as zf:
+                for name in entry_names:
+                    f = part_files.get(name)
+                    if f is None:
+                        copy_zip_entry(source_zip, source_zip.getinfo(name), zf)
+                    elif f in unchanged:
+                        copy_zip_entry(source_zip, unchanged[f], zf)
+                    elif name.endswith(XML_SUFFIXES):
+                        _, data = next(condensed)
+                        write_part(zf, f, name, data, compresslevel=compresslevel)
+                    else:
+                        write_part(zf, f, name, compresslevel=compresslevel)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
+        finally:
+            # Stops the worker processes if writing failed part way
+            condensed.close()
+    finally:
+        if source_zip is not None:
+            source_zip.close()
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file, pool=soffice_pool):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
-def validate_document(doc_path):
-    """Validate document by converting to HTML with soffice."""
-    # Determine the correct filter based on file extension
-    match doc_path.suffix.lower():
-        case ".docx":
-            filter_name = "html:HTML"
-        case ".pptx":
-            filter_name = "html:impress_html_Export"
-        case ".xlsx":
-            filter_name = "html:HTML (StarCalc)"
+def validate_document(doc_path, pool=None):
+    """Validate document by converting to HTML with soffice.
+
+    Args:
+        doc_path: Path of the Office file
+        pool: Optional SofficePool to convert with. None, or a pool whose worker
+            fails for reasons other than the document, uses a one-off soffice
+            process instead.
+    """
+    doc_path = Path(doc_path)
+    if pool is not None:
+        try:
+            return pool.validate(doc_path)
+        except RuntimeError as e:
+            print(
+                f"Warning: {e}. Validating with a new soffice process.",
+                file=sys.stderr,
+            )
 
     with tempfile.TemporaryDirectory() as temp_dir:
         try:
@@ -105,13 +296,13 @@ def validate_document(doc_path):
                     "soffice",
                     "--headless",
                     "--convert-to",
-                    filter_name,
+                    HTML_FILTERS[doc_path.suffix.lower()],
                     "--outdir",
                     temp_dir,
                     str(doc_path),
                 ],
                 capture_output=True,
-                timeout=10,
+                timeout=VALIDATION_TIMEOUT,
                 text=True,
             )
             if not (Path(temp_dir) / f"{doc_path.stem}.html").exists():
@@ -130,29 +321,697 @@ def validate_document(doc_path):
             return False
 
 
-def condense_xml(xml_file):
-    """Strip unnecessary whitespace and remove comments."""
-    with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
-
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_soffice_pool():
+    """Return a shared SofficePool for callers that validate many files.
+
+    Its workers start on first use and are stopped when the interpreter exits.
+
+    Returns:
+        SofficePool, or None when LibreOffice or its Python bindings are missing
+    """
+    global _shared_pool
+    if shutil.which("soffice") is None or _import_uno() is None:
+        return None
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = SofficePool()
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
+class SofficePool:
+    """Long-lived headless LibreOffice instances that validate Office files.
+
+    Each worker is a soffice process with its own user profile, listening on a
+    local UNO socket, so the start-up cost is paid once per worker rather than
+    once per file. Workers are started on first use, checked before every
+    conversion, and restarted when they have crashed or a conversion timed out.
+    Requires LibreOffice's Python bindings (uno), which are imported only here.
+
+    Example:
+        with SofficePool(size=4) as pool:
+            for directory, output_file in jobs:
+                pack_document(directory, output_file, validate=True, soffice_pool=pool)
+    """
+
+    def __init__(self, size=1, timeout=VALIDATION_TIMEOUT, startup_timeout=60):
+        """
+        Args:
+            size: Number of soffice processes (default: 1)
+            timeout: Seconds a single conversion may take (default: 10)
+            startup_timeout: Seconds to wait for a worker to accept connections
+        """
+        if _import_uno() is None:
+            raise ValueError("SofficePool requires LibreOffice's Python bindings (uno)")
+        if size < 1:
+            raise ValueError(f"size must be at least 1, got {size}")
+        self.timeout = timeout
+        self.startup_timeout = startup_timeout
+        self._workers = [_SofficeWorker() for _ in range(size)]
+        self._idle = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def validate(self, doc_path):
+        """Convert doc_path to HTML on an idle worker, like validate_document.
+
+        Returns:
+            bool: True if the conversion succeeded, False if the document could not
+                be converted or the conversion timed out
+
+        Raises:
+            RuntimeError: If the worker could not be started or died during the
+                conversion, which says nothing about the document
+        """
+        doc_path = Path(doc_path)
+        worker = self._idle.get()
+        try:
+            if not worker.is_healthy():
+                worker.restart(self.startup_timeout)
+            return worker.convert(
+                doc_path, HTML_FILTERS[doc_path.suffix.lower()], self.timeout
+            )
+        except Exception as e:
+            # A worker that still answers rejected the document itself
+            if worker.is_healthy():
+                print(f"Validation error: {e}", file=sys.stderr)
+                return False
+            worker.stop()
+            raise RuntimeError(f"soffice worker failed: {e}") from e
+        finally:
+            self._idle.put(worker)
+
+    def close(self):
+        """Stop every worker process and remove their profiles."""
+        for worker in self._workers:
+            worker.stop()
+            if worker.profile_dir is not None:
+                shutil.rmtree(worker.profile_dir, ignore_errors=True)
+                worker.profile_dir = None
+
+
+class _SofficeWorker:
+    """One soffice process of a SofficePool and its UNO connection."""
+
+    def __init__(self):
+        self.process = None
+        self.desktop = None
+        self.profile_dir = None
+
+    def is_healthy(self):
+        """Check that the process is running and still answers UNO calls."""
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            self.desktop.getComponents()
+            return True
+        except Exception:
+            return False
+
+    def restart(self, startup_timeout):
+        """Start a fresh soffice process and connect to it.
+
+        Raises:
+            RuntimeError: If soffice exits or does not accept connections in time
+        """
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        self.stop()
+        if self.profile_dir is None:
+            # Kept across restarts, so only the first start creates a profile
+            self.profile_dir = tempfile.mkdtemp(prefix="soffice_profile_")
+        port = _find_free_port()
+        connection = (
+            f"socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext"
+        )
+        self.process = subprocess.Popen(
+            [
+                "soffice",
+                "--headless",
+                "--invisible",
+                "--nologo",
+                "--norestore",
+                f"-env:UserInstallation={uno.systemPathToFileUrl(self.profile_dir)}",
+                f"--accept={connection}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except NoConnectException:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("soffice did not start")
+                time.sleep(0.25)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
+        )
+
+    def convert(self, doc_path, filter_name, timeout):
+        """Load doc_path and store it as HTML, killing the process on timeout."""
+        result = {}
+
+        def run():
+            try:
+                result["ok"] = self._convert(doc_path, filter_name.split(":", 1)[1])
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if thread.is_alive():
+            # The blocked call fails once the process is gone
+            self.stop()
+            print("Validation error: Timeout during conversion", file=sys.stderr)
+            return False
+        if "error" in result:
+            raise result["error"]
+        if not result["ok"]:
+            print("Validation error: Document validation failed", file=sys.stderr)
+        return result["ok"]
+
+    def _convert(self, doc_path, filter_name):
+        import uno
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            html_path = Path(temp_dir) / f"{doc_path.stem}.html"
+            document = self.desktop.loadComponentFromURL(
+                uno.systemPathToFileUrl(str(doc_path.resolve())),
+                "_blank",
+                0,
+                (_property("Hidden", True), _property("ReadOnly", True)),
+            )
+            if document is None:
+                return False
+            try:
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(html_path)),
+                    (_property("FilterName", filter_name),),
+                )
+            finally:
+                document.close(True)
+            return html_path.exists()
+
+    def stop(self):
+        """Terminate the process, if any. The profile is kept for a restart."""
+        self.desktop = None
+        if self.process is not None:
+            if self.process.poll() is None:
+                self.process.kill()
+            self.process.wait()
+            self.process = None
+
+
+def _property(name, value):
+    from com.sun.star.beans import PropertyValue
+
+    return PropertyValue(Name=name, Value=value)
+
+
+def _import_uno():
+    """Import LibreOffice's Python bindings, returning None if they are missing.
+
+    They are only needed by SofficePool, so importing pack does not load them.
+    """
+    try:
+        import uno
+    except ImportError:
+        return None
+    return uno
+
+
+def _find_free_port():
+    """Return a local TCP port that is currently unused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def copy_zip_entry(source_zip, info, target_zip):
+    """Copy a member between open zip archives without recompressing it.
+
+    The compressed bytes are copied as they are, so the cost depends on the
+    compressed size and no decompression or CRC computation takes place.
+
+    zipfile has no public API for writing compressed bytes, so this relies on its
+    internals (see _RAW_COPY_ATTRIBUTES). Should a Python version lack them, the
+    member is decompressed and recompressed through ZipFile.open() instead.
+
+    Args:
+        source_zip: zipfile.ZipFile opened for reading
+        info: zipfile.ZipInfo of the member to copy
+        target_zip: zipfile.ZipFile opened for writing
+    """
+    entry = copy.copy(info)
+    # zipfile adds a zip64 record to both headers when the sizes need one, so the
+    # source's is dropped; other extra fields (timestamps, ...) are kept
+    entry.extra = _strip_zip64_extra(info.extra)
+    if not (
+        hasattr(source_zip, "fp")
+        and all(hasattr(target_zip, name) for name in _RAW_COPY_ATTRIBUTES)
+    ):
+        with source_zip.open(info) as source, target_zip.open(entry, "w") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        return
+
+    # Local file header: 30 fixed bytes, then the file name and extra field
+    source_zip.fp.seek(info.header_offset)
+    header = source_zip.fp.read(30)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    source_zip.fp.seek(info.header_offset + 30 + name_length + extra_length)
+    data = source_zip.fp.read(info.compress_size)
+
+    entry.header_offset = target_zip.fp.tell()
+    # Sizes and CRC are known, so no data descriptor follows the data
+    entry.flag_bits &= ~0x08
+    target_zip.fp.write(entry.FileHeader())
+    target_zip.fp.write(data)
+    target_zip.filelist.append(entry)
+    target_zip.NameToInfo[entry.filename] = entry
+    target_zip.start_dir = target_zip.fp.tell()
+    target_zip._didModify = True
+
+
+def _strip_zip64_extra(extra):
+    """Remove the zip64 record (header ID 1) from a zip extra field."""
+    records = []
+    offset = 0
+    while offset + 4 <= len(extra):
+        header_id, size = struct.unpack("<HH", extra[offset : offset + 4])
+        end = offset + 4 + size
+        if header_id != 1:
+            records.append(extra[offset:end])
+        offset = end
+    return b"".join(records)
+
+
+def write_part(zf, part_path, arcname, data=None, compresslevel=DEFAULT_COMPRESSLEVEL):
+    """Add a part to an open archive, condensing XML parts on the way.
+
+    The entry gets a fixed timestamp and permissions, and is stored or deflated
+    depending on its type (see STORED_SUFFIXES). Parts are streamed at zlib's
+    default level; ZipFile.open() takes no level, so deflating at any other level
+    reads the part into memory and goes through ZipFile.writestr().
+
+    Args:
+        zf: zipfile.ZipFile opened for writing
+        part_path: Path of the part on disk
+        arcname: Name of the part in the archive
+        data: Condensed bytes of an XML part, if already produced (see
+            condense_xml_parts). Otherwise the part is streamed from part_path.
+        compresslevel: Deflate level 0-9 for compressible parts (default: 6)
+    """
+    part_path = Path(part_path)
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    info.external_attr = ZIP_EXTERNAL_ATTR
+    if part_path.suffix.lower() in STORED_SUFFIXES:
+        info.compress_type = zipfile.ZIP_STORED
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+        if compresslevel != DEFAULT_COMPRESSLEVEL and data is None:
+            if part_path.name.endswith(XML_SUFFIXES):
+                data = condense_xml_bytes(part_path)
+            else:
+                data = part_path.read_bytes()
+
+    if data is not None:
+        zf.writestr(info, data, compresslevel=compresslevel)
+        return
+
+    # The size is not known up front when streaming; condensing only shrinks a part
+    force_zip64 = part_path.stat().st_size > zipfile.ZIP64_LIMIT
+    with zf.open(info, "w", force_zip64=force_zip64) as f:
+        if part_path.name.endswith(XML_SUFFIXES):
+            _write_condensed(part_path, f)
+        else:
+            with open(part_path, "rb") as source:
+                shutil.copyfileobj(source, f, 1024 * 1024)
+
+
+def write_manifest(unpacked_dir, office_file, archived=(), pretty=True):
+    """Record the state of each part right after unpacking.
+
+    The manifest is a JSON file inside unpacked_dir (see manifest_path). For each
+    part it holds the CRC and size of the archive entry and the size and
+    modification time of the unpacked file, which is how pack_document tells
+    unchanged parts apart and unpack.py --incremental finds parts to keep. It also
+    lists the parts that were left in the archive instead of unpacked.
+
+    Args:
+        unpacked_dir: Directory the parts were unpacked into
+        office_file: Office file they were unpacked from
+        archived: Names of the parts that were not unpacked
+        pretty: Whether the XML parts were indented
+    """
+    unpacked_dir = Path(unpacked_dir)
+    parts = {}
+    with zipfile.ZipFile(office_file) as zf:
+        for info in zf.infolist():
+            part_path = unpacked_dir / info.filename
+            if info.is_dir() or not part_path.is_file():
+                continue
+            stat = part_path.stat()
+            parts[info.filename] = {
+                "crc": info.CRC,
+                "zip_size": info.file_size,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+    manifest = {
+        "original": str(Path(office_file).resolve()),
+        "parts": parts,
+        "archived": sorted(archived),
+        "pretty": pretty,
+    }
+    manifest_path(unpacked_dir).write_text(json.dumps(manifest, indent=2))
+
+
+def read_manifest(unpacked_dir):
+    """Load the manifest written by write_manifest, or None if there is none."""
+    try:
+        return json.loads(manifest_path(unpacked_dir).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def manifest_path(unpacked_dir):
+    """Path of the manifest for unpacked_dir: MANIFEST_NAME at its top level.
+
+    The manifest travels with the directory when it is copied or moved, and
+    iter_part_files() leaves it out, so it is never packed or validated as a part.
+    """
+    return Path(unpacked_dir) / MANIFEST_NAME
+
+
+def iter_part_files(unpacked_dir):
+    """Yield the files of an unpacked Office document, leaving out the manifest."""
+    unpacked_dir = Path(unpacked_dir)
+    manifest = manifest_path(unpacked_dir)
+    for f in unpacked_dir.rglob("*"):
+        if f.is_file() and f != manifest:
+            yield f
+
+
+def find_changed_parts(unpacked_dir):
+    """Names of the parts added or modified since unpacking, according to the manifest.
+
+    A part counts as modified if its size or modification time differs from the
+    manifest, as in pack_document. Deleted parts are not included.
+
+    Returns:
+        set[str] or None: Part names such as "word/document.xml", or None if
+            unpacked_dir has no manifest
+    """
+    unpacked_dir = Path(unpacked_dir)
+    manifest = read_manifest(unpacked_dir)
+    if manifest is None:
+        return None
+    recorded = manifest.get("parts", {})
+    changed = set()
+    for f in iter_part_files(unpacked_dir):
+        name = f.relative_to(unpacked_dir).as_posix()
+        record = recorded.get(name, {})
+        stat = f.stat()
+        if (record.get("size"), record.get("mtime_ns")) != (
+            stat.st_size,
+            stat.st_mtime_ns,
+        ):
+            changed.add(name)
+    return changed
+
+
+def _find_unchanged_parts(input_dir, part_files, source_zip):
+    """Map the part files that are unchanged since unpacking to their source entries.
+
+    XML parts are pretty-printed by unpacking, so they are matched by the manifest.
+    Other parts are extracted as they are and are also matched by their CRC.
+    """
+    manifest = read_manifest(input_dir) or {}
+    recorded = manifest.get("parts", {})
+    unchanged = {}
+    for f in part_files:
+        name = f.relative_to(input_dir).as_posix()
+        try:
+            info = source_zip.getinfo(name)
+        except KeyError:
             continue
+        stat = f.stat()
+        state = {
+            "crc": info.CRC,
+            "zip_size": info.file_size,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if recorded.get(name) == state:
+            unchanged[f] = info
+        elif (
+            not f.name.endswith(XML_SUFFIXES)
+            and stat.st_size == info.file_size
+            and _file_crc(f) == info.CRC
+        ):
+            unchanged[f] = info
+    return unchanged
+
+
+def _find_missing_targets(input_dir, part_files):
+    """Names of the parts that relationships point to but that are not on disk.
+
+    Args:
+        input_dir: Unpacked Office document directory
+        part_files: Mapping of part name to path, as in pack_document
+
+    Returns:
+        list[str]: Sorted part names, empty if every internal target exists
+    """
+    missing = set()
+    for name, f in part_files.items():
+        if not name.endswith(".rels"):
+            continue
+        # word/_rels/document.xml.rels describes word/document.xml
+        base = posixpath.dirname(posixpath.dirname(name))
+        try:
+            root = defusedxml.ElementTree.parse(f).getroot()
+        except Exception:
+            continue  # Malformed parts are reported by validation
+        for rel in root.iter(f"{{{RELATIONSHIPS_NAMESPACE}}}Relationship"):
+            target = rel.get("Target")
+            if not target or rel.get("TargetMode") == "External":
+                continue
+            target = urllib.parse.unquote(target.partition("#")[0])
+            if target.startswith("/"):
+                target_name = posixpath.normpath(target.lstrip("/"))
+            else:
+                target_name = posixpath.normpath(posixpath.join(base, target))
+            if target_name not in part_files and not (input_dir / target_name).is_dir():
+                missing.add(target_name)
+    return sorted(missing)
+
+
+def _file_crc(path):
+    """CRC-32 of a file, as stored in zip entries."""
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def _part_order(arcname):
+    """Sort key putting [Content_Types].xml first and the other parts by name."""
+    return (arcname != "[Content_Types].xml", arcname)
+
+
+def resolve_workers(workers, xml_files):
+    """Number of processes for a stage that handles each XML part separately.
+
+    Args:
+        workers: Requested number of processes, or None to decide by size: one per
+            CPU if the parts add up to PARALLEL_MIN_BYTES, otherwise 1
+        xml_files: Paths of the XML parts
+
+    Returns:
+        int: The number of processes, never more than there are parts
+    """
+    if workers is None:
+        total_size = sum(f.stat().st_size for f in xml_files)
+        workers = (os.cpu_count() or 1) if total_size >= PARALLEL_MIN_BYTES else 1
+    return min(workers, len(xml_files))
+
+
+def condense_xml_parts(xml_files, workers=None):
+    """Condense XML parts, in parallel when there are enough to be worth it.
+
+    Only a few parts per process are condensed ahead of the one being consumed, so
+    memory use stays bounded however many parts there are.
+
+    Args:
+        xml_files: Paths of the XML parts to condense
+        workers: Number of processes to use (see resolve_workers)
+
+    Yields:
+        tuple: (path, condensed bytes) for each part in the order given. The bytes
+            are None when a single process is used, in which case write_part()
+            streams the part instead.
+    """
+    workers = resolve_workers(workers, xml_files)
+    if workers <= 1:
+        for xml_file in xml_files:
+            yield xml_file, None
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        remaining = iter(xml_files)
+        pending = collections.deque()
+        while True:
+            while len(pending) < workers * 2:
+                xml_file = next(remaining, None)
+                if xml_file is None:
+                    break
+                pending.append(
+                    (xml_file, executor.submit(condense_xml_bytes, xml_file))
+                )
+            if not pending:
+                return
+            xml_file, future = pending.popleft()
+            yield xml_file, future.result()
+
+
+def condense_xml(xml_file):
+    """Strip unnecessary whitespace and remove comments.
+
+    The file is streamed through a SAX parser and rewritten as it is read, so
+    memory use does not depend on its size. Content of *:t elements (w:t, a:t)
+    is kept exactly, including whitespace-only text and comments.
+    """
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(f".{xml_file.name}.condensed")
+    try:
+        with open(temp_file, "wb") as f:
+            _write_condensed(xml_file, f)
+        os.replace(temp_file, xml_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+def condense_xml_bytes(xml_file):
+    """Return the condensed content of an XML file (see condense_xml)."""
+    buffer = io.BytesIO()
+    _write_condensed(xml_file, buffer)
+    return buffer.getvalue()
+
+
+def _write_condensed(xml_file, f):
+    """Stream the condensed XML of xml_file into the binary file object f."""
+    text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+    try:
+        handler = _CondenseHandler(text)
+        parser = defusedxml.sax.make_parser()
+        parser.setContentHandler(handler)
+        parser.setProperty(xml.sax.handler.property_lexical_handler, handler)
+        parser.parse(str(xml_file))
+    finally:
+        # Leave f open for the caller
+        text.flush()
+        text.detach()
+
+
+class _CondenseHandler(xml.sax.handler.ContentHandler, xml.sax.handler.LexicalHandler):
+    """SAX handler writing condensed XML with the same output as minidom's toxml()."""
+
+    def __init__(self, f):
+        super().__init__()
+        self._write = f.write
+        # Open elements as [tag name, keeps whitespace and comments, start tag unclosed]
+        self._stack = []
+        # Character data since the last node, and of the CDATA section being read
+        self._text = []
+        self._cdata = None
+
+    def startDocument(self):
+        self._write('<?xml version="1.0" encoding="UTF-8"?>')
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        self._close_start_tag()
+        self._write("<" + name)
+        # Namespace declarations come first, as minidom orders them
+        names = sorted(
+            attrs.getNames(), key=lambda n: not is_namespace_declaration(n)
+        )
+        for attr_name in names:
+            self._write(f' {attr_name}="{escape(attrs.getValue(attr_name))}"')
+        self._stack.append([name, name.endswith(":t"), True])
+
+    def endElement(self, name):
+        self._flush_text()
+        _, _, unclosed = self._stack.pop()
+        self._write("/>" if unclosed else f"</{name}>")
+
+    def characters(self, content):
+        if self._cdata is not None:
+            self._cdata.append(content)
+        else:
+            self._text.append(content)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        self._close_start_tag()
+        self._write(f"<?{target} {data}?>")
+
+    def comment(self, content):
+        self._flush_text()
+        # Comments outside the root element are kept, like those inside *:t
+        if not self._stack or self._stack[-1][1]:
+            self._close_start_tag()
+            self._write(f"<!--{content}-->")
+
+    def startCDATA(self):
+        self._cdata = []
+
+    def endCDATA(self):
+        data, self._cdata = "".join(self._cdata), None
+        # An empty section is not a node, so the text around it stays one run
+        if data:
+            self._flush_text()
+            self._close_start_tag()
+            self._write(f"<![CDATA[{data}]]>")
+
+    def _flush_text(self):
+        """Write the pending text run unless it is whitespace to be removed."""
+        if not self._text:
+            return
+        text, self._text = "".join(self._text), []
+        if self._stack[-1][1] or text.strip() != "":
+            self._close_start_tag()
+            self._write(escape(text))
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
-
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+    def _close_start_tag(self):
+        """Finish the parent's start tag before its first child is written."""
+        if self._stack and self._stack[-1][2]:
+            self._write(">")
+            self._stack[-1][2] = False
 
 
 if __name__ == "__main__":
@@ -1,29 +1,382 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--workers N] [--parts PATTERN ...]
+    python unpack.py <office_file> <output_dir> --xml-only
+    python unpack.py <new_revision> <output_dir> --incremental
+"""
+
+import argparse
+import fnmatch
+import os
 import random
 import sys
-import defusedxml.minidom
+import xml.sax.handler
+import defusedxml.sax
 import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+try:
+    from .xmlwriter import escape, is_namespace_declaration
+    from .pack import (
+        XML_SUFFIXES,
+        read_manifest,
+        resolve_workers,
+        write_manifest,
+    )
+except ImportError:
+    # Run as a script rather than imported from the ooxml.scripts package
+    from xmlwriter import escape, is_namespace_declaration
+    from pack import (
+        XML_SUFFIXES,
+        read_manifest,
+        resolve_workers,
+        write_manifest,
+    )
+
+# Indentation added per nesting level
+INDENT = "  "
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to format XML (default: one per CPU for files with "
+        "at least 1 MB of XML, otherwise 1)",
+    )
+    parser.add_argument(
+        "--parts",
+        nargs="+",
+        metavar="PATTERN",
+        help="Only unpack parts matching these patterns, e.g. 'word/*.xml'",
+    )
+    parser.add_argument(
+        "--xml-only",
+        action="store_true",
+        help="Leave media and other binary parts in the archive; pack.py copies "
+        "them from there",
+    )
+    parser.add_argument(
+        "--no-pretty",
+        dest="pretty",
+        action="store_false",
+        help="Leave XML as it is stored instead of indenting it",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Update a directory unpacked from an earlier revision, rewriting only "
+        "the parts that changed",
+    )
+    args = parser.parse_args()
+
+    try:
+        unpack_document(
+            args.office_file,
+            args.output_dir,
+            workers=args.workers,
+            parts=args.parts,
+            pretty=args.pretty,
+            xml_only=args.xml_only,
+            incremental=args.incremental,
+        )
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx"):
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(
+    input_file,
+    output_dir,
+    *,
+    workers=None,
+    parts=None,
+    pretty=True,
+    xml_only=False,
+    incremental=False,
+):
+    """Unpack an Office file (.docx/.pptx/.xlsx) into a directory.
+
+    XML parts are indented for reading and editing, in parallel when there are
+    several, and a manifest is written into the directory (see
+    pack.write_manifest) so that pack.py --original can reuse unchanged parts.
+    Parts that are not unpacked are listed in the manifest as left in the
+    archive, and pack.py copies them from the original file.
+
+    Args:
+        input_file: Path to the Office file
+        output_dir: Directory to unpack into (created if needed)
+        workers: Number of processes used to format XML parts. None uses one per
+            CPU if the parts add up to pack.PARALLEL_MIN_BYTES and 1 otherwise; 1
+            formats them serially.
+        parts: Optional list of shell-style patterns (fnmatch, where * also matches
+            /) selecting the parts to unpack, e.g. ["word/*.xml"]. By default
+            every part is unpacked.
+        pretty: If True (default), indent XML parts; otherwise leave them as stored
+        xml_only: If True, only unpack XML and .rels parts. Media and embedded
+            objects stay in the original file, which must then be kept until the
+            directory is packed.
+        incremental: If True and output_dir was unpacked before, keep the parts
+            whose archive entry (CRC and size) and unpacked file are unchanged
+            since then, rewrite the others and delete the parts that are gone.
+            Meant for unpacking a new revision of the same document.
+
+    Returns:
+        list[str]: Names of the unpacked parts
+
+    Raises:
+        ValueError: If input_file is not a zip archive or workers is below 1
+
+    Example:
+        for docx_file in Path("inbox").glob("*.docx"):
+            unpack_document(docx_file, Path("unpacked") / docx_file.stem, workers=4)
+    """
+    input_file = Path(input_file)
+    output_path = Path(output_dir)
+
+    if not zipfile.is_zipfile(input_file):
+        raise ValueError(f"{input_file} is not an Office file")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+
+    # Extract the selected parts
+    output_path.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(input_file) as zf:
+        members = [
+            info
+            for info in zf.infolist()
+            if not info.is_dir()
+            and (not xml_only or info.filename.endswith(XML_SUFFIXES))
+            and (
+                parts is None
+                or any(fnmatch.fnmatchcase(info.filename, p) for p in parts)
+            )
+        ]
+        names = [info.filename for info in members]
+        extracted = set(names)
+        kept = _find_kept_parts(output_path, members, pretty) if incremental else set()
+        zf.extractall(output_path, [m for m in members if m.filename not in kept])
+        archived = [
+            info.filename
+            for info in zf.infolist()
+            if not info.is_dir() and info.filename not in extracted
+        ]
+
+    # Remove the parts of the previous revision that are not in this one
+    if incremental:
+        previous = read_manifest(output_path) or {}
+        root = output_path.resolve()
+        for name in previous.get("parts", {}).keys() - extracted:
+            part_path = (output_path / name).resolve()
+            # A stale or edited manifest must not delete files outside output_dir
+            if part_path != root and part_path.is_relative_to(root):
+                part_path.unlink(missing_ok=True)
+
+    # Pretty print the XML parts
+    if pretty:
+        xml_files = [
+            output_path / name
+            for name in names
+            if name.endswith(XML_SUFFIXES) and name not in kept
+        ]
+        workers = resolve_workers(workers, xml_files)
+        if workers <= 1:
+            for xml_file in xml_files:
+                pretty_print_xml(xml_file)
+        else:
+            chunksize = max(1, len(xml_files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(pretty_print_xml, xml_files, chunksize=chunksize):
+                    pass
+
+    # Record what was unpacked, so pack.py --original can reuse unchanged parts
+    write_manifest(output_path, input_file, archived, pretty)
+    return names
+
+
+def _find_kept_parts(output_path, members, pretty):
+    """Names of the members that an earlier unpack into output_path left as they are.
+
+    A part is kept if its archive entry has the CRC and size recorded in the
+    manifest and its unpacked file has not been touched since.
+    """
+    manifest = read_manifest(output_path)
+    if manifest is None or manifest.get("pretty") != pretty:
+        return set()
+    recorded = manifest.get("parts", {})
+    kept = set()
+    for info in members:
+        record = recorded.get(info.filename)
+        if record is None:
+            continue
+        try:
+            stat = (output_path / info.filename).stat()
+        except OSError:
+            continue
+        state = {
+            "crc": info.CRC,
+            "zip_size": info.file_size,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+        if record == state:
+            kept.add(info.filename)
+    return kept
+
+
+def pretty_print_xml(xml_file):
+    """Indent an XML file in place, two spaces per level.
+
+    The layout is exactly that of minidom's toprettyxml(indent="  ",
+    encoding="ascii"), so line numbers do not depend on how a part was unpacked.
+    The file is streamed through a SAX parser, so memory use does not depend on
+    its size.
+    """
+    xml_file = Path(xml_file)
+    temp_file = xml_file.with_name(f".{xml_file.name}.pretty")
+    try:
+        with open(
+            temp_file, "w", encoding="ascii", errors="xmlcharrefreplace", newline="\n"
+        ) as f:
+            handler = _PrettyPrintHandler(f)
+            parser = defusedxml.sax.make_parser()
+            parser.setContentHandler(handler)
+            parser.setProperty(xml.sax.handler.property_lexical_handler, handler)
+            parser.parse(str(xml_file))
+        os.replace(temp_file, xml_file)
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+
+# States of an open element in _PrettyPrintHandler
+_EMPTY, _SINGLE, _OPEN = range(3)
+
+
+class _PrettyPrintHandler(
+    xml.sax.handler.ContentHandler, xml.sax.handler.LexicalHandler
+):
+    """SAX handler writing indented XML with the same output as minidom's toprettyxml().
+
+    minidom puts an element's only text child on the same line as its tags and
+    indents every other child on its own line. An element's first text child is
+    therefore held back until the next child or the end tag shows which applies.
+    """
+
+    def __init__(self, f):
+        super().__init__()
+        self._write = f.write
+        # Open elements as [tag name, indentation, state, held-back first child]
+        self._stack = []
+        # Character data since the last node, and of the CDATA section being read
+        self._text = []
+        self._cdata = None
+
+    def startDocument(self):
+        self._write('<?xml version="1.0" encoding="ascii"?>\n')
+
+    def startElement(self, name, attrs):
+        self._flush_text()
+        indent = self._add_child(None)
+        self._write(f"{indent}<{name}")
+        # Namespace declarations come first, as minidom orders them
+        names = sorted(
+            attrs.getNames(), key=lambda n: not is_namespace_declaration(n)
+        )
+        for attr_name in names:
+            self._write(f' {attr_name}="{escape(attrs.getValue(attr_name))}"')
+        self._stack.append([name, indent, _EMPTY, None])
+
+    def endElement(self, name):
+        self._flush_text()
+        _, indent, state, single = self._stack.pop()
+        if state == _EMPTY:
+            self._write("/>\n")
+        elif state == _SINGLE:
+            kind, data = single
+            text = escape(data) if kind == "text" else f"<![CDATA[{data}]]>"
+            self._write(f">{text}</{name}>\n")
+        else:
+            self._write(f"{indent}</{name}>\n")
+
+    def characters(self, content):
+        if self._cdata is not None:
+            self._cdata.append(content)
+        else:
+            self._text.append(content)
+
+    def processingInstruction(self, target, data):
+        self._flush_text()
+        indent = self._add_child(None)
+        self._write(f"{indent}<?{target} {data}?>\n")
+
+    def comment(self, content):
+        self._flush_text()
+        indent = self._add_child(None)
+        self._write(f"{indent}<!--{content}-->\n")
+
+    def startCDATA(self):
+        self._cdata = []
+
+    def endCDATA(self):
+        data, self._cdata = "".join(self._cdata), None
+        # An empty section is not a node, so the text around it stays one run
+        if data:
+            self._flush_text()
+            self._add_child(("cdata", data))
+
+    def _flush_text(self):
+        """Add the pending text run as a child of the current element."""
+        if self._text:
+            text, self._text = "".join(self._text), []
+            self._add_child(("text", text))
+
+    def _add_child(self, node):
+        """Account for a new child of the current element.
+
+        Text and CDATA children are passed as (kind, data) and written here, or
+        held back if they may be the element's only child. Other children are
+        passed as None and written by the caller.
+
+        Returns:
+            str: Indentation for the child
+        """
+        if not self._stack:
+            return ""
+        parent = self._stack[-1]
+        indent = parent[1] + INDENT
+        if parent[2] == _EMPTY and node is not None:
+            parent[2], parent[3] = _SINGLE, node
+            return indent
+        if parent[2] != _OPEN:
+            self._write(">\n")
+            if parent[2] == _SINGLE:
+                self._write_indented(parent[3], indent)
+            parent[2], parent[3] = _OPEN, None
+        if node is not None:
+            self._write_indented(node, indent)
+        return indent
+
+    def _write_indented(self, node, indent):
+        kind, data = node
+        if kind == "text":
+            self._write(escape(f"{indent}{data}\n"))
+        else:
+            # minidom writes CDATA sections without indentation
+            self._write(f"<![CDATA[{data}]]>")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,21 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--changed-only]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from pack import find_changed_parts, read_manifest
+from validation import (
+    BaseSchemaValidator,
+    DOCXSchemaValidator,
+    OriginalPackage,
+    PPTXSchemaValidator,
+    RedliningValidator,
+)
 
 
 def main():
@@ -24,6 +31,19 @@ def main():
         required=True,
         help="Path to original file (.docx/.pptx/.xlsx)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Processes used for XSD validation (default: 1)",
+    )
+    parser.add_argument(
+        "--changed-only",
+        action="store_true",
+        help="Only run per-file checks on the parts changed since unpack.py "
+        "unpacked the original",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -31,6 +51,8 @@ def main():
         help="Enable verbose output",
     )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
@@ -52,12 +74,26 @@ def main():
             print(f"Error: Validation not supported for file type {file_extension}")
             sys.exit(1)
 
-    # Run validators
+    # With --changed-only, find the changed parts from the manifest of unpack.py
+    changed_parts = None
+    if args.changed_only:
+        manifest = read_manifest(unpacked_dir) or {}
+        if manifest.get("original") == str(original_file.resolve()):
+            changed_parts = find_changed_parts(unpacked_dir)
+        else:
+            print(f"No unpack manifest for {original_file}, checking every part")
+
+    # Run validators, opening the original file only once
     success = True
-    for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
-        if not validator.validate():
-            success = False
+    with OriginalPackage(original_file) as original_package:
+        for V in validators:
+            options = {"verbose": args.verbose, "original_package": original_package}
+            if issubclass(V, BaseSchemaValidator):
+                options["workers"] = args.jobs
+                options["changed_parts"] = changed_parts
+            validator = V(unpacked_dir, original_file, **options)
+            if not validator.validate():
+                success = False
 
     if success:
         print("All validations PASSED!")
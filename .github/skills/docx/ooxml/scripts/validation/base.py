@@ -2,11 +2,110 @@
 Base validator with common validation logic for document files.
 """
 
+import collections
+import copy
+import io
 import re
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
+try:
+    from ..pack import iter_part_files, read_manifest
+except ImportError:
+    # validate.py imports this package from the scripts directory
+    from pack import iter_part_files, read_manifest
+
+# Directory holding the XSD files named in SCHEMA_MAPPINGS
+SCHEMAS_DIR = Path(__file__).parent.parent.parent / "schemas"
+
+# Facts about parsed files for the cross-file checks by (path, size, modification
+# time), least recently used first, see BaseSchemaValidator._get_summary
+_summary_cache = collections.OrderedDict()
+_summary_cache_lock = threading.Lock()
+# Files whose summaries are kept, so long-running processes stay bounded
+SUMMARY_CACHE_SIZE = 4096
+
+# Compiled schemas (or the error compiling them) by resolved path, shared by every
+# validator in the process
+_schema_cache = {}
+_schema_cache_lock = threading.Lock()
+
+
+def load_schema(schema_path):
+    """Return the compiled XMLSchema for schema_path, compiling it on first use.
+
+    Compiling a schema set such as wml.xsd takes far longer than validating a part
+    against it, so compiled schemas are cached for the life of the process. A
+    schema that fails to compile raises the same error on every call.
+    """
+    schema_path = Path(schema_path).resolve()
+    with _schema_cache_lock:
+        if schema_path not in _schema_cache:
+            try:
+                with open(schema_path, "rb") as xsd_file:
+                    parser = lxml.etree.XMLParser()
+                    xsd_doc = lxml.etree.parse(
+                        xsd_file, parser=parser, base_url=str(schema_path)
+                    )
+                _schema_cache[schema_path] = lxml.etree.XMLSchema(xsd_doc)
+            except lxml.etree.LxmlError as e:
+                _schema_cache[schema_path] = e
+        schema = _schema_cache[schema_path]
+    if isinstance(schema, Exception):
+        raise schema
+    return schema
+
+
+class OriginalPackage:
+    """The original Office file of a validation run, opened once.
+
+    Checks read the members they need with read() instead of extracting the
+    archive, and validators given the same instance share one open archive. Only
+    the members that are read are loaded. Close it when the run ends, e.g. by
+    using it as a context manager; a later read() opens it again.
+
+    Example:
+        with OriginalPackage(original_file) as original_package:
+            for V in validators:
+                V(unpacked_dir, original_file, original_package=original_package)
+    """
+
+    def __init__(self, original_file):
+        self.path = Path(original_file)
+        self._zip = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read(self, name):
+        """Return the bytes of the member name, or None if there is no such member.
+
+        Raises:
+            OSError, zipfile.BadZipFile: If the file cannot be read as an archive
+        """
+        with self._lock:
+            if self._zip is None:
+                self._zip = zipfile.ZipFile(self.path)
+            try:
+                return self._zip.read(name)
+            except KeyError:
+                return None
+
+    def close(self):
+        """Close the archive if it is open."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
 
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
@@ -103,13 +202,32 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self,
+        unpacked_dir,
+        original_file,
+        verbose=False,
+        original_package=None,
+        workers=1,
+        changed_parts=None,
+    ):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
         self.unpacked_dir = Path(unpacked_dir).resolve()
         self.original_file = Path(original_file)
         self.verbose = verbose
+        # Processes used for XSD validation. Each compiles the schemas it needs,
+        # which only pays off for packages with many parts.
+        self.workers = workers
+        # Shared with other validators of the same run when passed in, in which
+        # case the caller closes it; otherwise closed by close()
+        self._owns_original_package = original_package is None
+        self.original_package = original_package or OriginalPackage(original_file)
+        # Parsed files shared by all checks, see _parse_xml
+        self._parse_cache = {}
 
         # Set schemas directory
-        self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
+        self.schemas_dir = SCHEMAS_DIR
 
         # Get all XML and .rels files
         patterns = ["*.xml", "*.rels"]
@@ -120,18 +238,58 @@ class BaseSchemaValidator:
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+        # Files that per-file checks look at. With changed_parts (names such as
+        # "word/document.xml"), only those; the other files are taken as they are in
+        # the original and only take part in cross-file checks.
+        if changed_parts is None:
+            self.checked_files = list(self.xml_files)
+        else:
+            changed_parts = set(changed_parts)
+            self.checked_files = [
+                f
+                for f in self.xml_files
+                if f.relative_to(self.unpacked_dir).as_posix() in changed_parts
+            ]
+
+        # Parts that unpacking left in the original archive (unpack.py --xml-only)
+        manifest = read_manifest(self.unpacked_dir) or {}
+        self.archived_files = {
+            (self.unpacked_dir / name).resolve()
+            for name in manifest.get("archived", [])
+            if not (self.unpacked_dir / name).exists()
+        }
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
 
+    def close(self):
+        """Close the original file, unless it was passed in by the caller."""
+        if self._owns_original_package:
+            self.original_package.close()
+
+    @classmethod
+    def preload_schemas(cls):
+        """Compile every schema in SCHEMA_MAPPINGS ahead of the first validation.
+
+        Useful at the start of a long-running process, so that validating the first
+        document is not slower than the rest. Schemas that fail to compile are
+        skipped here and reported for the parts that need them.
+        """
+        for schema_file in sorted(set(cls.SCHEMA_MAPPINGS.values())):
+            try:
+                load_schema(SCHEMAS_DIR / schema_file)
+            except lxml.etree.LxmlError:
+                pass
+
     def validate_xml(self):
         """Validate that all XML files are well-formed."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.checked_files:
             try:
                 # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
+                self._parse_xml(xml_file)
             except lxml.etree.XMLSyntaxError as e:
                 errors.append(
                     f"  {xml_file.relative_to(self.unpacked_dir)}: "
@@ -157,9 +315,9 @@ class BaseSchemaValidator:
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
-        for xml_file in self.xml_files:
+        for xml_file in self.checked_files:
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                root = self._parse_xml(xml_file).getroot()
                 declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
 
                 for attr_val in [
@@ -187,82 +345,52 @@ class BaseSchemaValidator:
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
+        checked_files = set(self.checked_files)
 
         for xml_file in self.xml_files:
+            relative_path = xml_file.relative_to(self.unpacked_dir)
+            checked = xml_file in checked_files
             try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
+                if checked:
+                    ids = self._find_unique_ids(self._parse_xml(xml_file).getroot())
+                else:
+                    # Unchanged files only matter for globally unique IDs
+                    ids = self._get_summary(xml_file, "global_ids")
                 file_ids = {}  # Track IDs that must be unique within this file
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
-                    )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
+                for tag, attr_name, scope, id_value, line in ids:
+                    if scope == "global":
+                        # Check global uniqueness, where a changed file is involved
+                        if id_value in global_ids:
+                            prev_file, prev_line, prev_tag, prev_checked = global_ids[
+                                id_value
+                            ]
+                            if checked or prev_checked:
+                                errors.append(
+                                    f"  {relative_path}: "
+                                    f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                                    f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                                )
+                        else:
+                            global_ids[id_value] = (relative_path, line, tag, checked)
+                    elif scope == "file":
+                        # Check file-level uniqueness
+                        key = (tag, attr_name)
+                        if key not in file_ids:
+                            file_ids[key] = {}
+
+                        if id_value in file_ids[key]:
+                            prev_line = file_ids[key][id_value]
+                            errors.append(
+                                f"  {relative_path}: "
+                                f"Line {line}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                f"(first occurrence at line {prev_line})"
                             )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
+                        else:
+                            file_ids[key][id_value] = line
 
             except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+                errors.append(f"  {relative_path}: Error: {e}")
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -290,13 +418,17 @@ class BaseSchemaValidator:
 
         # Get all files in the unpacked directory (excluding reference files)
         all_files = []
-        for file_path in self.unpacked_dir.rglob("*"):
+        for file_path in iter_part_files(self.unpacked_dir):
             if (
-                file_path.is_file()
-                and file_path.name != "[Content_Types].xml"
+                file_path.name != "[Content_Types].xml"
                 and not file_path.name.endswith(".rels")
             ):  # This file is not referenced by .rels
                 all_files.append(file_path.resolve())
+        all_files.extend(
+            f
+            for f in self.archived_files
+            if f.name != "[Content_Types].xml" and not f.name.endswith(".rels")
+        )
 
         # Track all files that are referenced by any .rels file
         all_referenced_files = set()
@@ -309,8 +441,9 @@ class BaseSchemaValidator:
         # Check each .rels file
         for rels_file in rels_files:
             try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                # Internal relationship targets, from the summary so that unchanged
+                # .rels files are not parsed again on every run
+                targets = self._get_summary(rels_file, "targets")
 
                 # Get the directory where this .rels file is located
                 rels_dir = rels_file.parent
@@ -319,34 +452,29 @@ class BaseSchemaValidator:
                 referenced_files = set()
                 broken_refs = []
 
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
+                for target, line in targets:
+                    # Resolve the target path relative to the .rels file location
+                    if rels_file.name == ".rels":
+                        # Root .rels file - targets are relative to unpacked_dir
+                        target_path = self.unpacked_dir / target
+                    else:
+                        # Other .rels files - targets are relative to their parent's parent
+                        # e.g., word/_rels/document.xml.rels -> targets relative to word/
+                        base_dir = rels_dir.parent
+                        target_path = base_dir / target
+
+                    # Normalize the path and check if it exists
+                    try:
+                        target_path = target_path.resolve()
+                        if (
+                            target_path.exists() and target_path.is_file()
+                        ) or target_path in self.archived_files:
+                            referenced_files.add(target_path)
+                            all_referenced_files.add(target_path)
                         else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
+                            broken_refs.append((target, line))
+                    except (OSError, ValueError):
+                        broken_refs.append((target, line))
 
                 # Report broken references
                 if broken_refs:
@@ -390,9 +518,8 @@ class BaseSchemaValidator:
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
+        checked_files = set(self.checked_files)
 
         # Process each XML file that might contain r:id references
         for xml_file in self.xml_files:
@@ -409,9 +536,13 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
+            # Skip pairs where neither file changed
+            if xml_file not in checked_files and rels_file not in checked_files:
+                continue
+
             try:
                 # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
+                rels_root = self._parse_xml(rels_file).getroot()
                 rid_to_type = {}
 
                 for rel in rels_root.findall(
@@ -434,7 +565,7 @@ class BaseSchemaValidator:
                         rid_to_type[rid] = type_name
 
                 # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
+                xml_root = self._parse_xml(xml_file).getroot()
 
                 # Find all elements with r:id attributes
                 for elem in xml_root.iter():
@@ -531,7 +662,7 @@ class BaseSchemaValidator:
 
         try:
             # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
+            root = self._parse_xml(content_types_file).getroot()
             declared_parts = set()
             declared_extensions = set()
 
@@ -576,8 +707,8 @@ class BaseSchemaValidator:
             }
 
             # Get all files in the unpacked directory
-            all_files = list(self.unpacked_dir.rglob("*"))
-            all_files = [f for f in all_files if f.is_file()]
+            all_files = list(iter_part_files(self.unpacked_dir))
+            all_files.extend(self.archived_files)
 
             # Check all XML files for Override declarations
             for xml_file in self.xml_files:
@@ -593,8 +724,7 @@ class BaseSchemaValidator:
                     continue
 
                 try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
+                    root_name = self._get_summary(xml_file, "root")
 
                     if root_name in declarable_roots and path_str not in declared_parts:
                         errors.append(
@@ -673,7 +803,7 @@ class BaseSchemaValidator:
             if verbose:
                 relative_path = xml_file.relative_to(unpacked_dir)
                 print(f"FAILED - {relative_path}: {len(new_errors)} new error(s)")
-                for error in list(new_errors)[:3]:
+                for error in sorted(new_errors)[:3]:
                     truncated = error[:250] + "..." if len(error) > 250 else error
                     print(f"  - {truncated}")
             return False, new_errors
@@ -692,11 +822,10 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
-        for xml_file in self.xml_files:
+        results = self._validate_files_against_xsd()
+        for xml_file, result in zip(self.checked_files, results):
+            is_valid, new_file_errors = result
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
-            )
 
             if is_valid is None:
                 skipped_count += 1
@@ -712,14 +841,14 @@ class BaseSchemaValidator:
 
             # Has new errors
             new_errors.append(f"  {relative_path}: {len(new_file_errors)} new error(s)")
-            for error in list(new_file_errors)[:3]:  # Show first 3 errors
+            for error in sorted(new_file_errors)[:3]:  # Show first 3 errors
                 new_errors.append(
                     f"    - {error[:250]}..." if len(error) > 250 else f"    - {error}"
                 )
 
         # Print summary
         if self.verbose:
-            print(f"Validated {len(self.xml_files)} files:")
+            print(f"Validated {len(self.checked_files)} files:")
             print(f"  - Valid: {valid_count}")
             print(f"  - Skipped (no schema): {skipped_count}")
             if original_error_count:
@@ -738,6 +867,156 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _find_unique_ids(self, root):
+        """List the IDs under root that UNIQUE_ID_REQUIREMENTS restricts.
+
+        Elements inside mc:AlternateContent are left out.
+
+        Returns:
+            list: (tag, attr_name, scope, id_value, line) tuples in document order
+        """
+        # Remove all mc:AlternateContent elements from a copy of the tree,
+        # as the parsed tree is shared with the other checks
+        mc_path = ".//mc:AlternateContent"
+        mc_namespaces = {"mc": self.MC_NAMESPACE}
+        if root.xpath(mc_path, namespaces=mc_namespaces):
+            root = copy.deepcopy(root)
+            for elem in root.xpath(mc_path, namespaces=mc_namespaces):
+                elem.getparent().remove(elem)
+
+        ids = []
+        for elem in root.iter():
+            # Get the element name without namespace
+            tag = (
+                elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
+            )
+
+            # Check if this element type has ID uniqueness requirements
+            if tag in self.UNIQUE_ID_REQUIREMENTS:
+                attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                # Look for the specified attribute
+                for attr, value in elem.attrib.items():
+                    attr_local = (
+                        attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                    )
+                    if attr_local == attr_name:
+                        ids.append((tag, attr_name, scope, value, elem.sourceline))
+                        break
+        return ids
+
+    def _get_summary(self, xml_file, field):
+        """Return a fact about an XML file needed by the cross-file checks.
+
+        The fields are "root", the local name of the root element, "global_ids",
+        the IDs from _find_unique_ids that must be unique across files, and
+        "targets", the (Target, line) pairs of a .rels file's internal
+        relationships. They are cached for the process by path, size and
+        modification time, for the SUMMARY_CACHE_SIZE most recently used files, and
+        found without a full parse where possible, so checking the files that did
+        not change stays cheap.
+        """
+        xml_file = Path(xml_file)
+        stat = xml_file.stat()
+        key = (xml_file, stat.st_size, stat.st_mtime_ns)
+        with _summary_cache_lock:
+            summary = _summary_cache.get(key)
+            if summary is None:
+                summary = _summary_cache[key] = {}
+                while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+                    _summary_cache.popitem(last=False)
+            else:
+                _summary_cache.move_to_end(key)
+        if field in summary:
+            return summary[field]
+
+        if field == "root":
+            # Only the start of the file is read
+            parser = lxml.etree.XMLPullParser(events=("start",))
+            tag = None
+            with open(xml_file, "rb") as f:
+                while tag is None and (chunk := f.read(4096)):
+                    parser.feed(chunk)
+                    for _, elem in parser.read_events():
+                        tag = elem.tag
+                        break
+            if tag is None:
+                raise ValueError(f"No root element in {xml_file}")
+            summary[field] = tag.split("}")[-1] if "}" in tag else tag
+        elif field == "targets":
+            rels_root = self._parse_xml(xml_file).getroot()
+            summary[field] = [
+                (rel.get("Target"), rel.sourceline)
+                for rel in rels_root.findall(
+                    ".//ns:Relationship",
+                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
+                )
+                # Skip external URLs
+                if rel.get("Target")
+                and not rel.get("Target").startswith(("http", "mailto:"))
+            ]
+        else:
+            global_tags = [
+                tag
+                for tag, (_, scope) in self.UNIQUE_ID_REQUIREMENTS.items()
+                if scope == "global"
+            ]
+            # Most files contain none of the elements, which a text search shows
+            data = xml_file.read_bytes().lower()
+            if not any(tag.encode() in data for tag in global_tags):
+                summary[field] = []
+            else:
+                root = self._parse_xml(xml_file).getroot()
+                summary[field] = [
+                    i for i in self._find_unique_ids(root) if i[2] == "global"
+                ]
+        return summary[field]
+
+    def _parse_xml(self, xml_file):
+        """Parse an XML file, reusing the tree from an earlier call if unchanged.
+
+        Every check of a validation run parses the same files, so each is parsed
+        once and the tree shared. Callers must not modify the tree; a check that
+        needs to should work on a copy. A file that fails to parse raises the same
+        error on every call.
+        """
+        xml_file = Path(xml_file)
+        stat = xml_file.stat()
+        key = (stat.st_size, stat.st_mtime_ns)
+        cached = self._parse_cache.get(xml_file)
+        if cached is None or cached[0] != key:
+            try:
+                result = lxml.etree.parse(str(xml_file))
+            except lxml.etree.XMLSyntaxError as e:
+                result = e
+            cached = self._parse_cache[xml_file] = (key, result)
+        if isinstance(cached[1], Exception):
+            raise cached[1]
+        return cached[1]
+
+    def _validate_files_against_xsd(self):
+        """Run validate_file_against_xsd on each of self.checked_files.
+
+        The files are validated in parallel if the validator has several workers.
+
+        Returns:
+            list: (is_valid, new_errors_set) for each file, in the same order
+        """
+        workers = min(self.workers, len(self.checked_files))
+        if workers <= 1:
+            return [self.validate_file_against_xsd(f) for f in self.checked_files]
+
+        chunksize = max(1, len(self.checked_files) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_xsd_worker,
+            initargs=(type(self), self.unpacked_dir, self.original_file),
+        ) as executor:
+            results = executor.map(
+                _validate_file_in_worker, self.checked_files, chunksize=chunksize
+            )
+            return list(results)
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -823,24 +1102,26 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, data=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        If data is given, it is validated in place of the file's contents, with the
+        schema chosen by the file's path.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            # Load schema (compiled once per process)
+            schema = load_schema(schema_path)
 
             # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            if data is None:
+                # Shared tree: the steps below work on copies of it
+                xml_doc = self._parse_xml(xml_file)
+            else:
+                xml_doc = lxml.etree.parse(io.BytesIO(data))
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -875,33 +1156,20 @@ class BaseSchemaValidator:
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
         relative_path = xml_file.relative_to(unpacked_dir)
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
-
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        # Read the corresponding file from the original
+        data = self.original_package.read(relative_path.as_posix())
+        if data is None:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
-            is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
-            )
-            return errors if errors else set()
+        # Validate the specific file in original
+        is_valid, errors = self._validate_single_file_xsd(xml_file, unpacked_dir, data)
+        return errors if errors else set()
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.
@@ -947,5 +1215,19 @@ class BaseSchemaValidator:
         return lxml.etree.ElementTree(xml_copy), warnings
 
 
+# Validator of the worker process, set up by _init_xsd_worker
+_worker_validator = None
+
+
+def _init_xsd_worker(validator_class, unpacked_dir, original_file):
+    """Create the validator that a worker process uses for all its files."""
+    global _worker_validator
+    _worker_validator = validator_class(unpacked_dir, original_file)
+
+
+def _validate_file_in_worker(xml_file):
+    return _worker_validator.validate_file_against_xsd(xml_file)
+
+
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,21 @@
+"""
+Helpers shared by the SAX handlers that write XML in pack.py and unpack.py.
+
+Both handlers write markup the way minidom serializes it, so that packing and
+unpacking give the same bytes as the minidom-based tools they replace.
+"""
+
+
+def is_namespace_declaration(name):
+    """Check whether an attribute name declares a namespace (xmlns or xmlns:*)."""
+    return name == "xmlns" or name.startswith("xmlns:")
+
+
+def escape(data):
+    """Escape text and attribute values the way minidom does."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
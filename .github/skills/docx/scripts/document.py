@@ -7,12 +7,18 @@ Usage:
 
     # Initialize
     doc = Document('workspace/unpacked')
+    doc = Document.open('workspace/file.docx')  # Without unpacking
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', engine="lxml")  # Faster for large documents
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
     node = doc["word/document.xml"].get_node(tag="w:p", line_number=10)
 
+    # Apply many edits at once
+    with doc.batch():
+        doc["word/document.xml"].replace_node(node, "<w:r><w:t>new</w:t></w:r>")
+
     # Add comments
     doc.add_comment(start=node, end=node, text="Comment text")
     doc.reply_to_comment(parent_comment_id=0, text="Reply text")
@@ -24,21 +30,32 @@ Usage:
 
     # Save
     doc.save()
+    doc.save_docx('workspace/out.docx')
 """
 
+import copy
 import html
+import os
 import random
 import shutil
 import tempfile
+import zipfile
+from contextlib import ExitStack, contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 
+import lxml.etree
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.pack import (
+    copy_zip_entry,
+    pack_document,
+    write_part,
+)
+from ooxml.scripts.validation.base import OriginalPackage
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor, tracks_own_changes
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -71,20 +88,45 @@ class DocxXMLEditor(XMLEditor):
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        # Next free w:id for tracked changes, seeded on first use
+        self._next_change_id = None
+
+    def _rebuild_index(self):
+        """Rebuild the lookup indexes and re-seed the change ID allocator."""
+        super()._rebuild_index()
+        self._next_change_id = None
+
+    def _on_tree_change(self):
+        """Drop the indexes and re-seed the change ID allocator after direct changes."""
+        super()._on_tree_change()
+        if not self._editing:
+            self._next_change_id = None
 
     def _get_next_change_id(self):
-        """Get the next available change ID by checking all tracked change elements."""
-        max_id = -1
-        for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
-            for elem in elements:
-                change_id = elem.getAttribute("w:id")
-                if change_id:
-                    try:
-                        max_id = max(max_id, int(change_id))
-                    except ValueError:
-                        pass
-        return max_id + 1
+        """Allocate the next free change ID.
+
+        The first call scans all tracked change elements for the highest ID; later
+        calls count up from there. IDs are never handed out twice, even if the
+        element holding the highest ID is removed.
+        """
+        if self._next_change_id is None:
+            self._next_change_id = 0
+            for tag in ("w:ins", "w:del"):
+                for elem in self._find_all(tag):
+                    self._reserve_change_id(self._get_attribute(elem, "w:id"))
+        change_id = self._next_change_id
+        self._next_change_id += 1
+        return change_id
+
+    def _reserve_change_id(self, change_id):
+        """Keep the allocator above a w:id that was supplied by the caller."""
+        if self._next_change_id is None or not change_id:
+            # Not seeded yet: the first allocation scans the document anyway
+            return
+        try:
+            self._next_change_id = max(self._next_change_id, int(change_id) + 1)
+        except ValueError:
+            pass
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
@@ -124,6 +166,8 @@ class DocxXMLEditor(XMLEditor):
         - w:comment: gets w:author, w:date, w:initials
         - w16cex:commentExtensible: gets w16cex:dateUtc
 
+        The nodes are re-indexed afterwards so they can be found by the new IDs.
+
         Args:
             nodes: List of DOM nodes to process
         """
@@ -131,15 +175,6 @@ class DocxXMLEditor(XMLEditor):
 
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        def is_inside_deletion(elem):
-            """Check if element is inside a w:del element."""
-            parent = elem.parentNode
-            while parent:
-                if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:del":
-                    return True
-                parent = parent.parentNode
-            return False
-
         def add_rsid_to_p(elem):
             if not elem.hasAttribute("w:rsidR"):
                 elem.setAttribute("w:rsidR", self.rsid)
@@ -155,19 +190,24 @@ class DocxXMLEditor(XMLEditor):
                 self._ensure_w14_namespace()
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
+        def add_rsid_to_r(elem, inside_deletion):
             # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
+            if inside_deletion:
                 if not elem.hasAttribute("w:rsidDel"):
                     elem.setAttribute("w:rsidDel", self.rsid)
             else:
                 if not elem.hasAttribute("w:rsidR"):
                     elem.setAttribute("w:rsidR", self.rsid)
 
+        # Tracked changes still needing a w:id, numbered once every ID supplied
+        # in the new content has been reserved
+        unnumbered_changes = []
+
         def add_tracked_change_attrs(elem):
-            # Auto-assign w:id if not present
-            if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+            if elem.hasAttribute("w:id"):
+                self._reserve_change_id(elem.getAttribute("w:id"))
+            else:
+                unnumbered_changes.append(elem)
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
@@ -204,63 +244,61 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
-
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
-
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+            for elem, inside_deletion in self._iter_with_deletion_flag(node):
+                tag = elem.tagName
+                if tag == "w:r":
+                    add_rsid_to_r(elem, inside_deletion)
+                elif tag in handlers:
+                    handlers[tag](elem)
+
+        # Auto-assign w:id where not present
+        for elem in unnumbered_changes:
+            elem.setAttribute("w:id", str(self._get_next_change_id()))
+
+        # Make the new identifiers (w:id, w14:paraId, w:rsidR) visible to get_node
+        self._track_changes(nodes)
+
+    def _iter_with_deletion_flag(self, node):
+        """Yield (element, inside_deletion) for an element and its descendants.
+
+        Walks the subtree once in document order. inside_deletion tells whether
+        the element has a w:del ancestor, so the ancestors of the starting node
+        are only checked once rather than for every run below it.
+        """
+        inside_deletion = False
+        parent = node.parentNode
+        while parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+            if parent.tagName == "w:del":
+                inside_deletion = True
+                break
+            parent = parent.parentNode
+
+        stack = [(node, inside_deletion)]
+        while stack:
+            elem, inside_deletion = stack.pop()
+            yield elem, inside_deletion
+            inside_deletion = inside_deletion or elem.tagName == "w:del"
+            for child in reversed(elem.childNodes):
+                if child.nodeType == child.ELEMENT_NODE:
+                    stack.append((child, inside_deletion))
+
+    def _finish_edit(self, nodes):
+        """Inject attributes into the nodes added by replace_node, insert_*, or append_to."""
         self._inject_attributes_to_nodes(nodes)
-        return nodes
 
+    @tracks_own_changes
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
 
@@ -285,6 +323,9 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             doc["word/document.xml"].revert_insertion(para)
         """
+        # Apply queued batch edits first so the order matches unbatched code
+        self._flush_batch()
+
         # Collect insertions
         ins_elements = []
         if elem.tagName == "w:ins":
@@ -339,6 +380,7 @@ class DocxXMLEditor(XMLEditor):
 
         return [elem]
 
+    @tracks_own_changes
     def revert_deletion(self, elem):
         """Reject a deletion by re-inserting the deleted content.
 
@@ -364,6 +406,9 @@ class DocxXMLEditor(XMLEditor):
             para = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
             nodes = doc["word/document.xml"].revert_deletion(para)
         """
+        # Apply queued batch edits first so the order matches unbatched code
+        self._flush_batch()
+
         # Collect deletions FIRST - before we modify the DOM
         del_elements = []
         is_single_del = elem.tagName == "w:del"
@@ -418,11 +463,12 @@ class DocxXMLEditor(XMLEditor):
                 ins_elem.appendChild(new_run)
 
             # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            self._place_after(del_elem, [ins_elem])
+            self._inject_attributes_to_nodes([ins_elem])
 
             # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
+            if is_single_del:
+                created_insertion = ins_elem
 
         # Return based on input type
         if is_single_del and created_insertion:
@@ -479,6 +525,7 @@ class DocxXMLEditor(XMLEditor):
 
         return para.toxml()
 
+    @tracks_own_changes
     def suggest_deletion(self, elem):
         """Mark a w:r or w:p element as deleted with tracked changes (in-place DOM manipulation).
 
@@ -495,6 +542,9 @@ class DocxXMLEditor(XMLEditor):
         Raises:
             ValueError: If element has existing tracked changes or invalid structure
         """
+        # Apply queued batch edits first so the order matches unbatched code
+        self._flush_batch()
+
         if elem.nodeName == "w:r":
             # Check for existing w:delText
             if elem.getElementsByTagName("w:delText"):
@@ -556,6 +606,7 @@ class DocxXMLEditor(XMLEditor):
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
+                self._track_changes([rPr])
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
@@ -593,6 +644,419 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(LxmlXMLEditor):
+    """DocxXMLEditor counterpart for the lxml engine.
+
+    Applies the same RSID, author, date, and ID attributes as DocxXMLEditor and
+    offers the same tracked-change helpers, operating on lxml.etree elements.
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed tree for direct manipulation
+        root (lxml.etree._Element): Its root element
+    """
+
+    # Namespaces that _inject_attributes_to_nodes may need to declare on the root
+    _INJECTED_NAMESPACES = {
+        "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+        "w16du": "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
+        "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+    }
+
+    suggest_paragraph = staticmethod(DocxXMLEditor.suggest_paragraph)
+
+    def __init__(
+        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+    ):
+        """Initialize with required RSID and optional author.
+
+        Args:
+            xml_path: Path to XML file to edit
+            rsid: RSID to automatically apply to new elements
+            author: Author name for tracked changes and comments (default: "Claude")
+            initials: Author initials (default: "C")
+        """
+        super().__init__(xml_path)
+        self.rsid = rsid
+        self.author = author
+        self.initials = initials
+        self._next_change_id = None
+        # Prefix -> namespace used by injected attributes but not yet declared
+        self._pending_namespaces = {}
+
+    _get_next_change_id = DocxXMLEditor._get_next_change_id
+    _reserve_change_id = DocxXMLEditor._reserve_change_id
+
+    def _rebuild_index(self):
+        """Rebuild the lookup indexes and re-seed the change ID allocator."""
+        super()._rebuild_index()
+        self._next_change_id = None
+
+    def _on_tree_change(self):
+        """Drop the indexes and re-seed the change ID allocator after direct changes."""
+        super()._on_tree_change()
+        if not self._editing:
+            self._next_change_id = None
+
+    def _has_attribute(self, elem, name):
+        """Check whether a prefixed attribute is set on an element."""
+        qualified_name = self._resolve_name(name, elem, is_attribute=True)
+        return qualified_name is not None and qualified_name in elem.attrib
+
+    def _set_attribute(self, elem, name, value):
+        """Set a prefixed attribute, noting namespaces that still need declaring."""
+        qualified_name = self._resolve_name(name, elem, is_attribute=True)
+        if qualified_name is None:
+            prefix, _, local_name = name.partition(":")
+            uri = self._INJECTED_NAMESPACES[prefix]
+            self._pending_namespaces[prefix] = uri
+            qualified_name = f"{{{uri}}}{local_name}"
+        elem.set(qualified_name, value)
+
+    def _remove_attribute(self, elem, name):
+        """Remove a prefixed attribute if it is set."""
+        qualified_name = self._resolve_name(name, elem, is_attribute=True)
+        if qualified_name is not None:
+            elem.attrib.pop(qualified_name, None)
+
+    def _declare_pending_namespaces(self):
+        """Declare namespaces added by _set_attribute on the root element.
+
+        lxml gave the new attributes generated prefixes (ns0, ...) declared on their
+        elements; cleanup_namespaces moves those to the root under the intended
+        prefix, which makes nested declarations of the same namespaces redundant.
+        Every other declaration in the tree is kept, including ones that are only
+        referenced from attribute values such as mc:Ignorable.
+        """
+        if not self._pending_namespaces:
+            return
+        pending_uris = set(self._pending_namespaces.values())
+        keep_prefixes = {
+            prefix
+            for _, (prefix, uri) in lxml.etree.iterwalk(self.root, events=("start-ns",))
+            if prefix and uri not in pending_uris
+        }
+        lxml.etree.cleanup_namespaces(
+            self.root,
+            top_nsmap=self._pending_namespaces,
+            keep_ns_prefixes=sorted(keep_prefixes),
+        )
+        self._pending_namespaces = {}
+
+    def _create_element(self, tag, source=None):
+        """Create a detached element, copying attributes and content from source.
+
+        Args:
+            tag: Prefixed tag name of the new element
+            source: Optional element whose attributes, text, and children are moved
+                into the new element, which then takes its place in the tree
+        """
+        elem = self.root.makeelement(self._resolve_name(tag))
+        if source is not None:
+            elem.attrib.update(source.attrib)
+            elem.text = source.text
+            elem.extend(source)
+            elem.tail = source.tail
+            source.getparent().replace(source, elem)
+        return elem
+
+    def _inject_attributes_to_nodes(self, nodes):
+        """Inject RSID, author, and date attributes into elements where applicable.
+
+        Applies the same attributes as DocxXMLEditor._inject_attributes_to_nodes and
+        re-indexes the nodes afterwards so they can be found by the new IDs.
+
+        Args:
+            nodes: List of lxml.etree elements to process
+        """
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        def set_default(elem, name, value):
+            if not self._has_attribute(elem, name):
+                self._set_attribute(elem, name, value)
+
+        def add_rsid_to_p(elem):
+            set_default(elem, "w:rsidR", self.rsid)
+            set_default(elem, "w:rsidRDefault", self.rsid)
+            set_default(elem, "w:rsidP", self.rsid)
+            if not self._has_attribute(elem, "w14:paraId"):
+                self._set_attribute(elem, "w14:paraId", _generate_hex_id())
+            if not self._has_attribute(elem, "w14:textId"):
+                self._set_attribute(elem, "w14:textId", _generate_hex_id())
+
+        def add_rsid_to_r(elem, inside_deletion):
+            # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
+            if inside_deletion:
+                set_default(elem, "w:rsidDel", self.rsid)
+            else:
+                set_default(elem, "w:rsidR", self.rsid)
+
+        unnumbered_changes = []
+
+        def add_tracked_change_attrs(elem):
+            if self._has_attribute(elem, "w:id"):
+                self._reserve_change_id(self._get_attribute(elem, "w:id"))
+            else:
+                unnumbered_changes.append(elem)
+            set_default(elem, "w:author", self.author)
+            set_default(elem, "w:date", timestamp)
+            set_default(elem, "w16du:dateUtc", timestamp)
+
+        def add_comment_attrs(elem):
+            set_default(elem, "w:author", self.author)
+            set_default(elem, "w:date", timestamp)
+            set_default(elem, "w:initials", self.initials)
+
+        def add_comment_extensible_date(elem):
+            set_default(elem, "w16cex:dateUtc", timestamp)
+
+        def add_xml_space_to_t(elem):
+            # Add xml:space="preserve" to w:t if text has leading/trailing whitespace
+            text = elem.text
+            if text and (text[0].isspace() or text[-1].isspace()):
+                set_default(elem, "xml:space", "preserve")
+
+        # Keyed by {namespace}local so elements can be dispatched on elem.tag
+        handlers = {
+            self._resolve_name(tag): handler
+            for tag, handler in (
+                ("w:p", add_rsid_to_p),
+                ("w:t", add_xml_space_to_t),
+                ("w:ins", add_tracked_change_attrs),
+                ("w:del", add_tracked_change_attrs),
+                ("w:comment", add_comment_attrs),
+                ("w16cex:commentExtensible", add_comment_extensible_date),
+            )
+        }
+        run_tag = self._resolve_name("w:r")
+        for node in nodes:
+            for elem, inside_deletion in self._iter_with_deletion_flag(node):
+                if elem.tag == run_tag:
+                    add_rsid_to_r(elem, inside_deletion)
+                elif elem.tag in handlers:
+                    handlers[elem.tag](elem)
+        for elem in unnumbered_changes:
+            self._set_attribute(elem, "w:id", str(self._get_next_change_id()))
+
+        self._declare_pending_namespaces()
+        # Make the new identifiers (w:id, w14:paraId, w:rsidR) visible to get_node
+        self._track_changes(nodes)
+
+    def _iter_with_deletion_flag(self, node):
+        """Yield (element, inside_deletion) for an element and its descendants.
+
+        Same contract as DocxXMLEditor._iter_with_deletion_flag. lxml iterates
+        subtrees natively, so the elements below each w:del are collected up
+        front instead of carrying a flag through a Python-level walk.
+        """
+        del_tag = self._resolve_name("w:del")
+        if next(node.iterancestors(del_tag), None) is not None:
+            for elem in node.iter(lxml.etree.Element):
+                yield elem, True
+            return
+
+        deleted = set()
+        for del_elem in node.iter(del_tag):
+            deleted.update(del_elem.iterdescendants(lxml.etree.Element))
+        for elem in node.iter(lxml.etree.Element):
+            yield elem, elem in deleted
+
+    def _finish_edit(self, nodes):
+        """Inject attributes into the nodes added by replace_node, insert_*, or append_to."""
+        self._inject_attributes_to_nodes(nodes)
+
+    def _collect(self, elem, tag):
+        """Return elem itself if it has the tag, otherwise its descendants with it."""
+        if self._get_tag(elem) == tag:
+            return [elem]
+        return self._find_all(tag, elem)
+
+    def _swap_rsid(self, run, old_name, new_name):
+        """Move a run's RSID from old_name to new_name, defaulting to our RSID."""
+        if self._has_attribute(run, old_name):
+            self._set_attribute(run, new_name, self._get_attribute(run, old_name))
+            self._remove_attribute(run, old_name)
+        elif not self._has_attribute(run, new_name):
+            self._set_attribute(run, new_name, self.rsid)
+
+    def _mark_runs_deleted(self, elem):
+        """Convert w:t to w:delText and w:rsidR to w:rsidDel in elem and its runs."""
+        for t_elem in self._find_all("w:t", elem):
+            self._create_element("w:delText", source=t_elem)
+        for run in self._collect(elem, "w:r"):
+            self._swap_rsid(run, "w:rsidR", "w:rsidDel")
+
+    @tracks_own_changes
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+
+        Raises:
+            ValueError: If the element contains no w:ins elements
+        """
+        self._flush_batch()
+        ins_elements = self._collect(elem, "w:ins")
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{self._get_tag(elem)}> contains no insertions. "
+            )
+
+        for ins_elem in ins_elements:
+            if not self._find_all("w:r", ins_elem):
+                continue
+            self._mark_runs_deleted(ins_elem)
+
+            # Move all content from ins to a del wrapper inside it
+            del_wrapper = self._create_element("w:del")
+            del_wrapper.text, ins_elem.text = ins_elem.text, None
+            del_wrapper.extend(ins_elem)
+            ins_elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+
+        return [elem]
+
+    @tracks_own_changes
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+
+        Raises:
+            ValueError: If the element contains no w:del elements
+        """
+        self._flush_batch()
+        is_single_del = self._get_tag(elem) == "w:del"
+        del_elements = self._collect(elem, "w:del")
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{self._get_tag(elem)}> contains no deletions. "
+            )
+
+        created_insertion = None
+        for del_elem in del_elements:
+            runs = self._find_all("w:r", del_elem)
+            if not runs:
+                continue
+
+            ins_elem = self._create_element("w:ins")
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                for elem_copy in self._iter_elements(new_run):
+                    elem_copy.sourceline = 0
+                for del_text in self._find_all("w:delText", new_run):
+                    self._create_element("w:t", source=del_text)
+                self._swap_rsid(new_run, "w:rsidDel", "w:rsidR")
+                ins_elem.append(new_run)
+
+            # Directly after the deletion, before the text that followed it
+            ins_elem.tail, del_elem.tail = del_elem.tail, None
+            del_elem.addnext(ins_elem)
+            self._inject_attributes_to_nodes([ins_elem])
+            if is_single_del:
+                created_insertion = ins_elem
+
+        if is_single_del and created_insertion is not None:
+            return [elem, created_insertion]
+        return [elem]
+
+    @tracks_own_changes
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes.
+
+        See DocxXMLEditor.suggest_deletion.
+
+        Raises:
+            ValueError: If element has existing tracked changes or invalid structure
+        """
+        self._flush_batch()
+        tag = self._get_tag(elem)
+        if tag == "w:r":
+            if self._find_all("w:delText", elem):
+                raise ValueError("w:r element already contains w:delText")
+            self._mark_runs_deleted(elem)
+
+            # Wrap in w:del, keeping the text that followed the run outside
+            del_wrapper = self._create_element("w:del")
+            del_wrapper.tail, elem.tail = elem.tail, None
+            elem.getparent().replace(elem, del_wrapper)
+            del_wrapper.append(elem)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return del_wrapper
+
+        elif tag == "w:p":
+            if self._find_all("w:ins", elem) or self._find_all("w:del", elem):
+                raise ValueError("w:p element already contains tracked changes")
+
+            pPr_list = self._find_all("w:pPr", elem)
+            if pPr_list and self._find_all("w:numPr", pPr_list[0]):
+                # Add <w:del/> marker to w:rPr in w:pPr
+                rPr_list = self._find_all("w:rPr", pPr_list[0])
+                if rPr_list:
+                    rPr = rPr_list[0]
+                else:
+                    rPr = self._create_element("w:rPr")
+                    pPr_list[0].append(rPr)
+                rPr.insert(0, self._create_element("w:del"))
+                self._track_changes([rPr])
+
+            self._mark_runs_deleted(elem)
+
+            # Wrap all non-pPr children in <w:del>, together with the text around
+            # them, as the minidom engine moves text nodes along with elements
+            pPr_tag = self._resolve_name("w:pPr")
+            del_wrapper = self._create_element("w:del")
+            del_wrapper.text, elem.text = elem.text, None
+            for child in list(elem):
+                if child.tag != pPr_tag:
+                    del_wrapper.append(child)
+                    continue
+                if child.tail:
+                    last = del_wrapper[-1] if len(del_wrapper) else None
+                    if last is None:
+                        del_wrapper.text = (del_wrapper.text or "") + child.tail
+                    else:
+                        last.tail = (last.tail or "") + child.tail
+                    child.tail = None
+            elem.append(del_wrapper)
+
+            self._inject_attributes_to_nodes([del_wrapper])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+
+# Editor class used by Document for each engine
+EDITOR_CLASSES = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
+
+def _get_editor_class(engine):
+    """Return the editor class for an engine name, raising ValueError if unknown."""
+    if engine not in EDITOR_CLASSES:
+        raise ValueError(
+            f"Unknown engine: {engine}. Expected one of: {', '.join(EDITOR_CLASSES)}"
+        )
+    return EDITOR_CLASSES[engine]
+
+
+def _replace_file(source, target):
+    """Copy source over target atomically, so no reader sees a half-written file."""
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = target.with_name(f".{target.name}.tmp")
+    try:
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -619,6 +1083,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        engine="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,21 +1095,98 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            engine: XML engine for the editors, "minidom" or "lxml" (default: "minidom").
+                lxml parses and saves large documents much faster and with less memory;
+                its nodes are lxml.etree elements instead of minidom nodes.
+
+        The directory is copied when the Document is created. Parts are read from
+        that copy, which is also the baseline for change detection and redlining
+        validation, so changes that other tools make to unpacked_dir afterwards are
+        not seen, and save() overwrites them in the parts this document changed.
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
+        self._editor_class = _get_editor_class(engine)
 
         # Create temporary directory with subdirectories for unpacked content and baseline
         self.temp_dir = tempfile.mkdtemp(prefix="docx_")
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self.unpacked_path.mkdir()
+
+        # Snapshot the original with plain file copies, which costs milliseconds.
+        # Hard links would be cheaper but would follow in-place edits by other
+        # tools. Parts are copied into unpacked_path when first accessed, and the
+        # snapshot is packed into the validation baseline only when validation runs.
+        self._source_dir = Path(self.temp_dir) / "original"
+        shutil.copytree(self.original_path, self._source_dir)
+        self._source_zip = None
+        self._original_docx = None
+
+        self._initialize(rsid, track_revisions, author, initials)
+
+    @classmethod
+    def open(
+        cls,
+        docx_file,
+        rsid=None,
+        track_revisions=False,
+        author="Claude",
+        initials="C",
+        engine="minidom",
+    ):
+        """
+        Open a .docx file directly, without unpacking it first.
+
+        Parts are extracted from the archive only when they are first accessed, and
+        the file itself serves as the validation baseline. Use save_docx() to write
+        the result; parts that were never accessed are copied into the new archive
+        without being decompressed.
+
+        Args:
+            docx_file: Path to the .docx file
+            rsid, track_revisions, author, initials, engine: As for Document()
+
+        Returns:
+            Document: The opened document
+
+        Raises:
+            ValueError: If the file does not exist or is not a zip archive
+
+        Example:
+            doc = Document.open("contract.docx", author="John Doe", initials="JD")
+            node = doc["word/document.xml"].get_node(tag="w:p", contains="Term")
+            doc.add_comment(start=node, end=node, text="Check this")
+            doc.save_docx("contract-reviewed.docx")
+        """
+        docx_file = Path(docx_file)
+        if not docx_file.is_file():
+            raise ValueError(f"File not found: {docx_file}")
+        if not zipfile.is_zipfile(docx_file):
+            raise ValueError(f"Not a zip archive: {docx_file}")
+
+        doc = cls.__new__(cls)
+        doc.original_path = docx_file
+        doc._editor_class = _get_editor_class(engine)
+
+        doc.temp_dir = tempfile.mkdtemp(prefix="docx_")
+        doc.unpacked_path = Path(doc.temp_dir) / "unpacked"
+        doc.unpacked_path.mkdir()
+
+        # Keep the original readable even if docx_file is overwritten by save_docx()
+        # or changed by another tool
+        doc._original_docx = Path(
+            shutil.copy2(docx_file, Path(doc.temp_dir) / "original.docx")
+        )
+        doc._source_dir = None
+        doc._source_zip = zipfile.ZipFile(doc._original_docx)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        doc._initialize(rsid, track_revisions, author, initials)
+        return doc
 
+    def _initialize(self, rsid, track_revisions, author, initials):
+        """Set up editors, comment state, and tracking infrastructure."""
         self.word_path = self.unpacked_path / "word"
 
         # Generate RSID if not provided
@@ -657,6 +1199,13 @@ class Document:
 
         # Cache for lazy-loaded editors
         self._editors = {}
+        # Parts changed since the original, and those not yet written by a save
+        self._changed_parts = set()
+        self._unsaved_parts = set()
+        # (size, mtime_ns) of parts copied from the original, see _find_changed_parts
+        self._extracted_parts = {}
+        # Collects the editors' batches while inside batch(), None otherwise
+        self._batch_stack = None
 
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
@@ -677,9 +1226,21 @@ class Document:
         # Add author to people.xml
         self._add_author_to_people(author)
 
+    @property
+    def original_docx(self):
+        """Path of the original .docx used as the validation baseline.
+
+        For an unpacked directory this is packed from the snapshot on first access.
+        """
+        if self._original_docx is None:
+            original_docx = Path(self.temp_dir) / "original.docx"
+            pack_document(self._source_dir, original_docx, validate=False)
+            self._original_docx = original_docx
+        return self._original_docx
+
     def __getitem__(self, xml_path: str) -> DocxXMLEditor:
         """
-        Get or create a DocxXMLEditor for the specified XML file.
+        Get or create a DocxXMLEditor (or LxmlDocxXMLEditor) for the specified XML file.
 
         Enables lazy-loaded editors with bracket notation:
             node = doc["word/document.xml"].get_node(tag="w:p", line_number=42)
@@ -702,14 +1263,42 @@ class Document:
         """
         if xml_path not in self._editors:
             file_path = self.unpacked_path / xml_path
-            if not file_path.exists():
+            if not self._has_part(file_path):
                 raise ValueError(f"XML file not found: {xml_path}")
-            # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
+            # Use the engine's editor with RSID, author, and initials for all editors
+            self._editors[xml_path] = self._editor_class(
                 file_path, rsid=self.rsid, author=self.author, initials=self.initials
             )
+            if self._batch_stack is not None:
+                self._batch_stack.enter_context(self._editors[xml_path].batch())
         return self._editors[xml_path]
 
+    @contextmanager
+    def batch(self):
+        """
+        Queue edits to all XML files and apply them together when the block exits.
+
+        See XMLEditor.batch. Each file's edits are parsed in one pass and stamped
+        with a single timestamp, which makes thousands of edits much cheaper.
+        Comments can be added inside the block, but replies to them only after it.
+
+        Example:
+            with doc.batch():
+                for node, new_xml in replacements:
+                    doc["word/document.xml"].replace_node(node, new_xml)
+        """
+        if self._batch_stack is not None:
+            yield self
+            return
+        with ExitStack() as stack:
+            self._batch_stack = stack
+            try:
+                for editor in self._editors.values():
+                    stack.enter_context(editor.batch())
+                yield self
+            finally:
+                self._batch_stack = None
+
     def add_comment(self, start, end, text: str) -> int:
         """
         Add a comment spanning from one element to another.
@@ -737,7 +1326,7 @@ class Document:
 
         # If end node is a paragraph, append comment markup inside it
         # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
+        if self._document._get_tag(end) == "w:p":
             self._document.append_to(end, self._comment_range_end_xml(comment_id))
         else:
             self._document.insert_after(end, self._comment_range_end_xml(comment_id))
@@ -800,7 +1389,7 @@ class Document:
         self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
-        parent_ref_run = parent_ref_elem.parentNode
+        parent_ref_run = self._document._get_parent(parent_ref_elem)
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
@@ -832,68 +1421,240 @@ class Document:
 
     def __del__(self):
         """Clean up temporary directory on deletion."""
+        if getattr(self, "_source_zip", None) is not None:
+            self._source_zip.close()
         if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
             shutil.rmtree(self.temp_dir)
 
-    def validate(self) -> None:
+    def validate(self, changed_only=True) -> None:
         """
         Validate the document against XSD schema and redlining rules.
 
+        Args:
+            changed_only: If True (default), per-file checks only look at the parts
+                that differ from the original, whether written by the editors or
+                by hand; cross-file checks such as relationships and content types
+                still cover every part.
+
         Raises:
             ValueError: If validation fails.
         """
-        # Create validators with current state
-        schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
-        redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
-        )
+        # The validators read every part from disk
+        self._extract_all_parts()
+
+        # Create validators with current state, sharing one open original
+        with OriginalPackage(self.original_docx) as original_package:
+            schema_validator = DOCXSchemaValidator(
+                self.unpacked_path,
+                self.original_docx,
+                verbose=False,
+                original_package=original_package,
+                changed_parts=self._find_changed_parts() if changed_only else None,
+            )
+            redlining_validator = RedliningValidator(
+                self.unpacked_path,
+                self.original_docx,
+                verbose=False,
+                original_package=original_package,
+            )
 
-        # Run validations
-        if not schema_validator.validate():
-            raise ValueError("Schema validation failed")
-        if not redlining_validator.validate():
-            raise ValueError("Redlining validation failed")
+            # Run validations
+            if not schema_validator.validate():
+                raise ValueError("Schema validation failed")
+            if not redlining_validator.validate():
+                raise ValueError("Redlining validation failed")
 
-    def save(self, destination=None, validate=True) -> None:
+    def save(self, destination=None, validate=True) -> set[str]:
         """
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        Only files that were changed since the last save are serialized, and when
+        saving back to the original directory only files that differ from the
+        original, including files written into unpacked_path by hand, are copied.
+
+        For a document from open(), destination is a directory to unpack into; with
+        no destination the original .docx file is overwritten (see save_docx).
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
             validate: If True, validates document before saving (default: True).
+
+        Returns:
+            set[str]: Paths of the parts written by this save, relative to the
+                document root (e.g. "word/document.xml")
         """
-        # Only ensure comment relationships and content types if comment files exist
-        if self.comments_path.exists():
-            self._ensure_comment_relationships()
-            self._ensure_comment_content_types()
+        if self._source_zip is not None and destination is None:
+            return self.save_docx(self.original_path, validate=validate)
 
-        # Save all modified XML files in temp directory
-        for editor in self._editors.values():
-            editor.save()
+        saved_parts = self._save_editors()
 
         # Validate by default
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if self._source_dir is not None and target_path.resolve() == self.original_path.resolve():
+            # The original directory already has every other file
+            for name in sorted(self._find_changed_parts()):
+                _replace_file(self.unpacked_path / name, target_path / name)
+        else:
+            # Copy contents from temp directory to destination
+            self._extract_all_parts()
+            shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        return saved_parts
+
+    def save_docx(self, output_file, validate=True) -> set[str]:
+        """
+        Save the document as a .docx file.
+
+        Edited parts are condensed like pack.py does. For a document from open(),
+        parts that were not changed are copied from the original archive as
+        compressed bytes, without being decompressed or parsed.
+
+        Args:
+            output_file: Path of the .docx file to write (may be the original file)
+            validate: If True, validates document before saving (default: True).
+
+        Returns:
+            set[str]: Paths of the parts written by this save, relative to the
+                document root (e.g. "word/document.xml")
+        """
+        output_file = Path(output_file)
+        saved_parts = self._save_editors()
+        if validate:
+            self.validate()
+
+        if self._source_zip is None:
+            self._extract_all_parts()
+            pack_document(self.unpacked_path, output_file, validate=False)
+            return saved_parts
+
+        # Write next to the target and swap it in, so the original can be overwritten
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(suffix=".docx", dir=output_file.parent)
+        os.close(fd)
+        try:
+            changed_parts = self._find_changed_parts()
+            with zipfile.ZipFile(temp_name, "w", zipfile.ZIP_DEFLATED) as zf:
+                written = set()
+                for info in self._source_zip.infolist():
+                    if info.filename in changed_parts:
+                        self._write_part(zf, self.unpacked_path / info.filename)
+                    else:
+                        copy_zip_entry(self._source_zip, info, zf)
+                    written.add(info.filename)
+                # Parts created during editing, such as comments.xml
+                for part_path in sorted(self.unpacked_path.rglob("*")):
+                    name = part_path.relative_to(self.unpacked_path).as_posix()
+                    if part_path.is_file() and name not in written:
+                        self._write_part(zf, part_path)
+            os.replace(temp_name, output_file)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return saved_parts
+
+    def _save_editors(self):
+        """Finish comment metadata and write changed editors back to their files.
+
+        Returns:
+            set[str]: Parts written or created since the last save
+        """
+        # Only ensure comment relationships and content types if comment files exist
+        if self._has_part(self.comments_path):
+            self._ensure_comment_relationships()
+            self._ensure_comment_content_types()
+
+        # Write every open editor whose content changed, including changes made
+        # to its DOM directly rather than through the editing methods
+        saved_parts, self._unsaved_parts = self._unsaved_parts, set()
+        for xml_path, editor in self._editors.items():
+            if editor.save_if_changed():
+                saved_parts.add(xml_path)
+        self._changed_parts |= saved_parts
+        return saved_parts
+
+    def _write_part(self, zf, part_path):
+        """Add an extracted part to an archive, condensing XML like pack.py does."""
+        write_part(zf, part_path, part_path.relative_to(self.unpacked_path).as_posix())
+
+    # ==================== Private: Source Archive ====================
+
+    def _has_part(self, path):
+        """Check whether a part exists, copying it from the original if needed.
+
+        Args:
+            path: Path of the part inside unpacked_path
+        """
+        if path.exists():
+            return True
+        name = path.relative_to(self.unpacked_path).as_posix()
+        if self._source_dir is not None:
+            source = self._source_dir / name
+            if not source.is_file():
+                return False
+            # A copy, not a link: editors write to unpacked_path in place
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source, path)
+        else:
+            try:
+                self._source_zip.getinfo(name)
+            except KeyError:
+                return False
+            self._source_zip.extract(name, self.unpacked_path)
+        stat = path.stat()
+        self._extracted_parts[name] = (stat.st_size, stat.st_mtime_ns)
+        return True
+
+    def _create_part_from_template(self, path):
+        """Copy the template with the same file name to path, a new part."""
+        shutil.copy(TEMPLATE_DIR / path.name, path)
+        self._unsaved_parts.add(path.relative_to(self.unpacked_path).as_posix())
+
+    def _extract_all_parts(self):
+        """Copy every part of the original that is not in unpacked_path yet."""
+        if self._source_dir is not None:
+            for source in self._source_dir.rglob("*"):
+                if source.is_file():
+                    self._has_part(
+                        self.unpacked_path / source.relative_to(self._source_dir)
+                    )
+            return
+        for info in self._source_zip.infolist():
+            if not info.is_dir():
+                self._has_part(self.unpacked_path / info.filename)
+
+    def _find_changed_parts(self):
+        """Return the parts in unpacked_path that differ from the original.
+
+        Besides the parts written by the editors, this compares every part copied
+        from the original with its size and modification time when it was copied,
+        so files written into unpacked_path by hand are included, as are new files.
+
+        Returns:
+            set[str]: Part names relative to the document root
+        """
+        changed_parts = set(self._changed_parts)
+        for part_path in self.unpacked_path.rglob("*"):
+            if part_path.is_file():
+                name = part_path.relative_to(self.unpacked_path).as_posix()
+                stat = part_path.stat()
+                if self._extracted_parts.get(name) != (stat.st_size, stat.st_mtime_ns):
+                    changed_parts.add(name)
+        return changed_parts
 
     # ==================== Private: Initialization ====================
 
     def _get_next_comment_id(self):
         """Get the next available comment ID."""
-        if not self.comments_path.exists():
+        if not self._has_part(self.comments_path):
             return 0
 
         editor = self["word/comments.xml"]
         max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor._find_all("w:comment"):
+            comment_id = editor._get_attribute(comment_elem, "w:id")
             if comment_id:
                 try:
                     max_id = max(max_id, int(comment_id))
@@ -903,21 +1664,21 @@ class Document:
 
     def _load_existing_comments(self):
         """Load existing comments from files to enable replies."""
-        if not self.comments_path.exists():
+        if not self._has_part(self.comments_path):
             return {}
 
         editor = self["word/comments.xml"]
         existing = {}
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor._find_all("w:comment"):
+            comment_id = editor._get_attribute(comment_elem, "w:id")
             if not comment_id:
                 continue
 
             # Find para_id from the w:p element within the comment
             para_id = None
-            for p_elem in comment_elem.getElementsByTagName("w:p"):
-                para_id = p_elem.getAttribute("w14:paraId")
+            for p_elem in editor._find_all("w:p", comment_elem):
+                para_id = editor._get_attribute(p_elem, "w14:paraId")
                 if para_id:
                     break
 
@@ -953,9 +1714,8 @@ class Document:
 
     def _update_people_xml(self, path):
         """Create people.xml if it doesn't exist."""
-        if not path.exists():
-            # Copy from template
-            shutil.copy(TEMPLATE_DIR / "people.xml", path)
+        if not self._has_part(path):
+            self._create_part_from_template(path)
 
     def _add_content_type_for_people(self, path):
         """Add people.xml content type to [Content_Types].xml if not already present."""
@@ -965,7 +1725,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor._get_root()
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -976,8 +1736,8 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor._get_root()
+        root_tag = editor._get_tag(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
 
@@ -998,13 +1758,14 @@ class Document:
         """
         editor = self["word/settings.xml"]
         root = editor.get_node(tag="w:settings")
-        prefix = root.tagName.split(":")[0] if ":" in root.tagName else "w"
+        root_tag = editor._get_tag(root)
+        prefix = root_tag.split(":")[0] if ":" in root_tag else "w"
 
         # Conditionally add trackRevisions if requested
         if track_revisions:
             track_revisions_exists = any(
-                elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
+                editor._get_tag(elem) == f"{prefix}:trackRevisions"
+                for elem in editor._find_all(f"{prefix}:trackRevisions")
             )
 
             if not track_revisions_exists:
@@ -1012,20 +1773,21 @@ class Document:
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor._find_all(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
                         break
                 if not inserted:
                     # Insert as first child of settings
-                    if root.firstChild:
-                        editor.insert_before(root.firstChild, track_rev_xml)
+                    first_child = editor._get_first_child(root)
+                    if first_child is not None:
+                        editor.insert_before(first_child, track_rev_xml)
                     else:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor._find_all(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,15 +1798,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor._find_all(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
-                    f"{prefix}:clrSchemeMapping"
-                )
+                clr_elements = editor._find_all(f"{prefix}:clrSchemeMapping")
                 if clr_elements:
                     editor.insert_before(clr_elements[0], rsids_xml)
                     inserted = True
@@ -1055,8 +1815,8 @@ class Document:
             # Check if this rsid already exists
             rsids_elem = rsids_elements[0]
             rsid_exists = any(
-                elem.getAttribute(f"{prefix}:val") == self.rsid
-                for elem in rsids_elem.getElementsByTagName(f"{prefix}:rsid")
+                editor._get_attribute(elem, f"{prefix}:val") == self.rsid
+                for elem in editor._find_all(f"{prefix}:rsid", rsids_elem)
             )
 
             if not rsid_exists:
@@ -1069,8 +1829,8 @@ class Document:
         self, comment_id, para_id, text, author, initials, timestamp
     ):
         """Add a single comment to comments.xml."""
-        if not self.comments_path.exists():
-            shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
+        if not self._has_part(self.comments_path):
+            self._create_part_from_template(self.comments_path)
 
         editor = self["word/comments.xml"]
         root = editor.get_node(tag="w:comments")
@@ -1090,10 +1850,8 @@ class Document:
 
     def _add_to_comments_extended_xml(self, para_id, parent_para_id):
         """Add a single comment to commentsExtended.xml."""
-        if not self.comments_extended_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
-            )
+        if not self._has_part(self.comments_extended_path):
+            self._create_part_from_template(self.comments_extended_path)
 
         editor = self["word/commentsExtended.xml"]
         root = editor.get_node(tag="w15:commentsEx")
@@ -1106,8 +1864,8 @@ class Document:
 
     def _add_to_comments_ids_xml(self, para_id, durable_id):
         """Add a single comment to commentsIds.xml."""
-        if not self.comments_ids_path.exists():
-            shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
+        if not self._has_part(self.comments_ids_path):
+            self._create_part_from_template(self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
         root = editor.get_node(tag="w16cid:commentsIds")
@@ -1117,10 +1875,8 @@ class Document:
 
     def _add_to_comments_extensible_xml(self, durable_id):
         """Add a single comment to commentsExtensible.xml."""
-        if not self.comments_extensible_path.exists():
-            shutil.copy(
-                TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
-            )
+        if not self._has_part(self.comments_extensible_path):
+            self._create_part_from_template(self.comments_extensible_path)
 
         editor = self["word/commentsExtensible.xml"]
         root = editor.get_node(tag="w16cex:commentsExtensible")
@@ -1159,22 +1915,22 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
+        for rel_elem in editor._find_all("Relationship"):
+            if editor._get_attribute(rel_elem, "Target") == target:
                 return True
         return False
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
+        for override_elem in editor._find_all("Override"):
+            if editor._get_attribute(override_elem, "PartName") == part_name:
                 return True
         return False
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
+        for person_elem in editor._find_all("w15:person"):
+            if editor._get_attribute(person_elem, "w15:author") == author:
                 return True
         return False
 
@@ -1183,7 +1939,7 @@ class Document:
         people_path = self.word_path / "people.xml"
 
         # people.xml should already exist from _setup_tracking
-        if not people_path.exists():
+        if not self._has_part(people_path):
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
@@ -1207,8 +1963,8 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor._get_root()
+        root_tag = editor._get_tag(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
 
@@ -1247,7 +2003,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._get_root()
 
         # Add Override elements
         overrides = [
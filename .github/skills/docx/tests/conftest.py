@@ -0,0 +1,7 @@
+"""Shared setup for the docx skill tests."""
+
+import sys
+from pathlib import Path
+
+# Make the skill's "scripts" and "ooxml" directories importable as in SKILL.md
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
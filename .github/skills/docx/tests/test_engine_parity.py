@@ -0,0 +1,572 @@
+"""
+Parity tests for the minidom and lxml editing engines.
+
+Each test runs the same Document operations once per engine on a small unpacked
+document and checks that lookups find the same nodes and that the saved parts are
+identical after canonicalization.
+"""
+
+import copy
+import random
+import re
+import shutil
+
+import lxml.etree
+import pytest
+
+from scripts.document import Document
+from scripts.utilities import LxmlXMLEditor, XMLEditor
+
+ENGINES = ("minidom", "lxml")
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+WP14_NS = "http://schemas.microsoft.com/office/word/2010/wordprocessingDrawing"
+
+PARTS = {
+    "[Content_Types].xml": """\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+  <Default Extension="xml" ContentType="application/xml"/>
+  <Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+  <Override PartName="/word/settings.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.settings+xml"/>
+</Types>
+""",
+    "_rels/.rels": """\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>
+""",
+    "word/_rels/document.xml.rels": """\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+  <Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings" Target="settings.xml"/>
+</Relationships>
+""",
+    "word/settings.xml": f"""\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:settings xmlns:w="{W_NS}">
+  <w:defaultTabStop w:val="720"/>
+  <w:compat/>
+</w:settings>
+""",
+    "word/document.xml": f"""\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}" xmlns:w14="{W14_NS}" xmlns:r="{R_NS}">
+  <w:body>
+    <w:p w14:paraId="10000001" w:rsidR="00A00001">
+      <w:r>
+        <w:t>Alpha clause applies.</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="10000002" w:rsidR="00A00001">
+      <w:r>
+        <w:t xml:space="preserve">Beta clause </w:t>
+      </w:r>
+      <w:r>
+        <w:rPr><w:b/></w:rPr>
+        <w:t>applies twice.</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="10000003" w:rsidR="00A00002">
+      <w:ins w:id="101" w:author="Other" w:date="2024-01-01T00:00:00Z">
+        <w:r>
+          <w:t>Inserted by other.</w:t>
+        </w:r>
+      </w:ins>
+    </w:p>
+    <w:p w14:paraId="10000004" w:rsidR="00A00002">
+      <w:r>
+        <w:t xml:space="preserve">Kept </w:t>
+      </w:r>
+      <w:del w:id="102" w:author="Other" w:date="2024-01-01T00:00:00Z">
+        <w:r>
+          <w:delText>deleted by other.</w:delText>
+        </w:r>
+      </w:del>
+    </w:p>
+    <w:p w14:paraId="10000005" w:rsidR="00A00001">
+      <w:r>
+        <w:t>Alpha clause appears again.</w:t>
+      </w:r>
+    </w:p>
+    <w:p w14:paraId="10000006" w:rsidR="00A00001">
+      <w:pPr>
+        <w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr>
+      </w:pPr>
+      <w:r>
+        <w:t>Numbered item.</w:t>
+      </w:r>
+    </w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+""",
+}
+
+TIMESTAMP = re.compile(rb"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\dZ")
+
+
+@pytest.fixture
+def unpacked(tmp_path):
+    """Write the test document as an unpacked directory and return its path."""
+    root = tmp_path / "source"
+    for name, content in PARTS.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return root
+
+
+def open_document(unpacked, tmp_path, engine):
+    """Open a private copy of the test document with fixed RSID and random IDs."""
+    work = tmp_path / engine
+    shutil.copytree(unpacked, work)
+    # Comment paraIds and durableIds are random
+    random.seed(0)
+    return Document(work, rsid="00C0FFEE", author="Tester", initials="T", engine=engine)
+
+
+def saved_parts(doc):
+    """Save without validation and return each XML part in canonical form."""
+    doc.save(validate=False)
+    parts = {}
+    for path in sorted(doc.original_path.rglob("*.xml*")):
+        content = lxml.etree.tostring(lxml.etree.parse(str(path)), method="c14n")
+        parts[path.relative_to(doc.original_path).as_posix()] = TIMESTAMP.sub(
+            b"TIMESTAMP", content
+        )
+    return parts
+
+
+def describe(editor, elem):
+    """Summarize an element in engine-independent terms."""
+    return (
+        editor._get_tag(elem),
+        editor._get_line(elem),
+        editor._get_attribute(elem, "w14:paraId"),
+        editor._get_element_text(elem),
+    )
+
+
+def run_on_both_engines(unpacked, tmp_path, operation):
+    """Apply operation(doc) with each engine and return {engine: result}."""
+    results = {}
+    for engine in ENGINES:
+        doc = open_document(unpacked, tmp_path, engine)
+        results[engine] = operation(doc)
+    return results
+
+
+def assert_same_parts(unpacked, tmp_path, operation):
+    """Apply operation(doc) with each engine and compare the saved parts."""
+
+    def apply_and_save(doc):
+        operation(doc)
+        return saved_parts(doc)
+
+    results = run_on_both_engines(unpacked, tmp_path, apply_and_save)
+    minidom_parts, lxml_parts = results["minidom"], results["lxml"]
+    assert minidom_parts.keys() == lxml_parts.keys()
+    for name in minidom_parts:
+        assert minidom_parts[name] == lxml_parts[name], name
+
+
+# ==================== Lookups ====================
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"tag": "w:p", "attrs": {"w14:paraId": "10000002"}},
+        {"tag": "w:ins", "attrs": {"w:id": "101"}},
+        {"tag": "w:del", "attrs": {"w:id": "102", "w:author": "Other"}},
+        {"tag": "w:p", "attrs": {"w:rsidR": "00A00002"}, "contains": "Kept"},
+        {"tag": "w:p", "line_number": 9},
+        {"tag": "w:t", "line_number": range(20, 24)},
+        {"tag": "w:r", "line_number": range(9, 16), "contains": "twice"},
+        {"tag": "w:p", "contains": "Beta clause applies"},
+        {"tag": "w:t", "contains": "&#65;lpha clause applies"},
+        {"tag": "w:delText", "contains": "deleted"},
+        {"tag": "w:p", "contains": "Alpha clause", "line_number": range(30, 40)},
+        {"tag": "w:p", "attrs": {"w:rsidR": "00A00001"}, "line_number": 4},
+    ],
+    ids=repr,
+)
+def test_get_node_finds_same_node(unpacked, tmp_path, query):
+    def lookup(doc):
+        editor = doc["word/document.xml"]
+        return describe(editor, editor.get_node(**query))
+
+    results = run_on_both_engines(unpacked, tmp_path, lookup)
+    assert results["minidom"] == results["lxml"]
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ({"tag": "w:p", "contains": "Alpha clause"}, "Multiple nodes found"),
+        ({"tag": "w:p", "attrs": {"w:rsidR": "00A00002"}}, "Multiple nodes found"),
+        ({"tag": "w:p", "attrs": {"w14:paraId": "DEADBEEF"}}, "Node not found"),
+        ({"tag": "w:p", "line_number": 1000}, "Node not found"),
+        ({"tag": "w:t", "contains": "no such text"}, "Node not found"),
+    ],
+    ids=repr,
+)
+def test_get_node_fails_the_same_way(unpacked, tmp_path, query, message):
+    def lookup(doc):
+        with pytest.raises(ValueError, match=message) as excinfo:
+            doc["word/document.xml"].get_node(**query)
+        return str(excinfo.value)
+
+    results = run_on_both_engines(unpacked, tmp_path, lookup)
+    assert results["minidom"] == results["lxml"]
+
+
+def test_line_numbers_past_65535_match(tmp_path):
+    # libxml2 misreports lines from 65535 on, which only a file this long shows
+    paragraphs = "".join(
+        f'    <w:p w14:paraId="{i:08X}">\n'
+        f"      <w:r><w:t>Paragraph {i}</w:t></w:r>\n"
+        "    </w:p>\n"
+        for i in range(22000)
+    )
+    path = tmp_path / "long.xml"
+    path.write_text(
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NS}" xmlns:w14="{W14_NS}">\n'
+        f"  <w:body>\n{paragraphs}  </w:body>\n</w:document>\n",
+        encoding="utf-8",
+    )
+    editors = [XMLEditor(path), LxmlXMLEditor(path)]
+
+    def lookup(editor, tag, line_number):
+        try:
+            return describe(editor, editor.get_node(tag=tag, line_number=line_number))
+        except ValueError as e:
+            return str(e)
+
+    for line in [*range(65530, 65545), 65999]:
+        for tag in ("w:p", "w:r"):
+            results = [lookup(editor, tag, line) for editor in editors]
+            assert results[0] == results[1], (tag, line)
+    assert lookup(editors[1], "w:p", 65536)[1] == 65536
+
+    # Ranges that cross the line where libxml2 goes wrong
+    for tag, lines in [("w:p", range(65534, 65537)), ("w:t", range(65500, 65600))]:
+        results = [
+            [describe(editor, elem) for elem in editor._line_index.lookup(tag, lines)]
+            for editor in editors
+        ]
+        assert results[0] and results[0] == results[1], (tag, lines)
+
+
+def test_get_node_sees_edits(unpacked, tmp_path):
+    def edit_and_lookup(doc):
+        editor = doc["word/document.xml"]
+        para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+        editor.replace_node(
+            para, '<w:p w14:paraId="20000001"><w:r><w:t>Omega</w:t></w:r></w:p>'
+        )
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+        found = [
+            editor.get_node(tag="w:p", attrs={"w14:paraId": "20000001"}),
+            editor.get_node(tag="w:p", contains="Omega"),
+            editor.get_node(tag="w:p", contains="Alpha clause"),
+        ]
+        return [describe(editor, elem) for elem in found]
+
+    results = run_on_both_engines(unpacked, tmp_path, edit_and_lookup)
+    assert results["minidom"] == results["lxml"]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_edits_keep_unrelated_text_indexes(unpacked, tmp_path, engine):
+    doc = open_document(unpacked, tmp_path, engine)
+    editor = doc["word/document.xml"]
+    for tag, text in [("w:p", "Beta clause"), ("w:delText", "deleted")]:
+        editor.get_node(tag=tag, contains=text)
+    deleted_text_index = editor._text_indexes["w:delText"]
+
+    run = editor.get_node(tag="w:r", contains="applies twice")
+    editor.replace_node(run, "<w:r><w:t>applies once.</w:t></w:r>")
+    # Only the tags of the new run and its ancestors are searched afresh
+    assert "w:p" not in editor._text_indexes
+    assert editor._text_indexes["w:delText"] is deleted_text_index
+    editor.get_node(tag="w:p", contains="Beta clause applies once.")
+    editor.get_node(tag="w:delText", contains="deleted")
+    assert editor._text_indexes["w:delText"] is deleted_text_index
+
+
+# ==================== Direct tree changes ====================
+# The minidom and lxml node APIs differ, so each helper handles both.
+
+
+def duplicate(elem):
+    """Insert a deep copy of an element directly after it."""
+    if hasattr(elem, "parentNode"):
+        elem.parentNode.insertBefore(elem.cloneNode(True), elem.nextSibling)
+    else:
+        elem.addnext(copy.deepcopy(elem))
+
+
+def detach(elem):
+    """Remove an element from its parent."""
+    if hasattr(elem, "parentNode"):
+        elem.parentNode.removeChild(elem)
+    else:
+        elem.getparent().remove(elem)
+
+
+def set_text(t_elem, text):
+    """Replace the text of a w:t element."""
+    if hasattr(t_elem, "firstChild"):
+        t_elem.firstChild.data = text
+    else:
+        t_elem.text = text
+
+
+def set_change_id(elem, value):
+    """Set the w:id attribute of an element."""
+    if hasattr(elem, "setAttribute"):
+        elem.setAttribute("w:id", value)
+    else:
+        elem.set(f"{{{W_NS}}}id", value)
+
+
+def test_get_node_sees_direct_changes(unpacked, tmp_path):
+    def change_and_lookup(doc):
+        editor = doc["word/document.xml"]
+        para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+        duplicate(para)
+        with pytest.raises(ValueError, match="Multiple nodes found"):
+            editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+        with pytest.raises(ValueError, match="Multiple nodes found"):
+            editor.get_node(tag="w:p", contains="Alpha clause applies")
+
+        set_text(editor.get_node(tag="w:t", contains="Numbered item"), "Zeta item.")
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(tag="w:p", contains="Numbered item")
+
+        set_change_id(editor.get_node(tag="w:ins", attrs={"w:id": "101"}), "900")
+        detach(editor.get_node(tag="w:p", attrs={"w14:paraId": "10000005"}))
+        # Edits made afterwards through the editor keep the direct changes visible
+        editor.insert_after(para, "<w:p><w:r><w:t>After</w:t></w:r></w:p>")
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(tag="w:ins", attrs={"w:id": "101"})
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(tag="w:p", contains="appears again")
+        found = [
+            editor.get_node(tag="w:p", contains="Zeta item"),
+            editor.get_node(tag="w:ins", attrs={"w:id": "900"}),
+            editor.get_node(tag="w:p", contains="After"),
+        ]
+        return editor.modified, [describe(editor, elem) for elem in found]
+
+    results = run_on_both_engines(unpacked, tmp_path, change_and_lookup)
+    assert results["minidom"] == results["lxml"]
+    assert results["minidom"][0] is True
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_get_node_misses_without_rebuilding(unpacked, tmp_path, engine, monkeypatch):
+    doc = open_document(unpacked, tmp_path, engine)
+    editor = doc["word/document.xml"]
+    editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+    monkeypatch.setattr(
+        editor, "_rebuild_index", lambda: pytest.fail("index was rebuilt")
+    )
+    for query in (
+        {"tag": "w:p", "attrs": {"w14:paraId": "DEADBEEF"}},
+        {"tag": "w:p", "contains": "no such text"},
+        {"tag": "w:bookmarkStart"},
+    ):
+        with pytest.raises(ValueError, match="Node not found"):
+            editor.get_node(**query)
+
+
+# ==================== Edits ====================
+
+
+def replace_run(doc):
+    editor = doc["word/document.xml"]
+    run = editor.get_node(tag="w:r", contains="Beta clause")
+    editor.replace_node(
+        run,
+        '<w:del><w:r><w:delText xml:space="preserve">Beta clause </w:delText></w:r>'
+        "</w:del><w:ins><w:r><w:t>Gamma clause </w:t></w:r></w:ins>",
+    )
+
+
+def insert_paragraphs(doc):
+    editor = doc["word/document.xml"]
+    para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000002"})
+    nodes = editor.insert_after(para, "<w:p><w:r><w:t>After</w:t></w:r></w:p>")
+    editor.insert_after(nodes[-1], "<w:p><w:r><w:t>After that</w:t></w:r></w:p>")
+    editor.insert_before(para, "<w:p><w:r><w:t>Before</w:t></w:r></w:p>")
+
+
+def append_run(doc):
+    editor = doc["word/document.xml"]
+    para = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+    editor.append_to(para, "<w:ins><w:r><w:t> Appended.</w:t></w:r></w:ins>")
+
+
+def suggest_run_deletion(doc):
+    editor = doc["word/document.xml"]
+    editor.suggest_deletion(editor.get_node(tag="w:r", contains="twice"))
+
+
+def suggest_paragraph_deletion(doc):
+    editor = doc["word/document.xml"]
+    editor.suggest_deletion(editor.get_node(tag="w:p", contains="appears again"))
+
+
+def suggest_list_item_deletion(doc):
+    editor = doc["word/document.xml"]
+    editor.suggest_deletion(editor.get_node(tag="w:p", contains="Numbered item"))
+
+
+def revert_insertion(doc):
+    editor = doc["word/document.xml"]
+    editor.revert_insertion(editor.get_node(tag="w:ins", attrs={"w:id": "101"}))
+
+
+def revert_deletion(doc):
+    editor = doc["word/document.xml"]
+    editor.revert_deletion(editor.get_node(tag="w:del", attrs={"w:id": "102"}))
+
+
+def revert_in_paragraphs(doc):
+    editor = doc["word/document.xml"]
+    editor.revert_insertion(editor.get_node(tag="w:p", contains="Inserted by"))
+    editor.revert_deletion(editor.get_node(tag="w:p", contains="Kept"))
+
+
+def add_comments(doc):
+    editor = doc["word/document.xml"]
+    start = editor.get_node(tag="w:r", contains="Beta clause")
+    end = editor.get_node(tag="w:r", contains="twice")
+    comment_id = doc.add_comment(start=start, end=end, text="Why twice?")
+    doc.reply_to_comment(parent_comment_id=comment_id, text="Because.")
+
+
+def batched_edits(doc):
+    editor = doc["word/document.xml"]
+    targets = [
+        editor.get_node(tag="w:p", attrs={"w14:paraId": para_id})
+        for para_id in ("10000001", "10000002", "10000005")
+    ]
+    with doc.batch():
+        for number, para in enumerate(targets):
+            editor.insert_after(
+                para, f"<w:p><w:ins><w:r><w:t>Batch {number}</w:t></w:r></w:ins></w:p>"
+            )
+
+
+def edits_with_helpers(doc):
+    """Mix queued edits with in-place helpers; return revert_deletion's result."""
+    editor = doc["word/document.xml"]
+    first = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000001"})
+    run = editor.get_node(tag="w:r", contains="twice")
+    deletion = editor.get_node(tag="w:del", attrs={"w:id": "102"})
+    last = editor.get_node(tag="w:p", attrs={"w14:paraId": "10000006"})
+    editor.insert_after(first, "<w:p><w:ins><w:r><w:t>New</w:t></w:r></w:ins></w:p>")
+    editor.suggest_deletion(run)
+    result = editor.revert_deletion(deletion)
+    editor.insert_before(last, "<w:p><w:ins><w:r><w:t>End</w:t></w:r></w:ins></w:p>")
+    return [editor._get_tag(elem) for elem in result]
+
+
+def batched_edits_with_helpers(doc):
+    with doc.batch():
+        return edits_with_helpers(doc)
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        replace_run,
+        insert_paragraphs,
+        append_run,
+        suggest_run_deletion,
+        suggest_paragraph_deletion,
+        suggest_list_item_deletion,
+        revert_insertion,
+        revert_deletion,
+        revert_in_paragraphs,
+        add_comments,
+        batched_edits,
+        batched_edits_with_helpers,
+    ],
+    ids=lambda operation: operation.__name__,
+)
+def test_edits_save_identical_parts(unpacked, tmp_path, operation):
+    assert_same_parts(unpacked, tmp_path, operation)
+
+
+def test_unedited_document_saves_identical_parts(unpacked, tmp_path):
+    assert_same_parts(unpacked, tmp_path, lambda doc: None)
+
+
+def test_nested_namespace_declarations_are_kept(unpacked, tmp_path):
+    # w14 is only declared below the root, so the new paraIds make the editor
+    # declare it there; wp14 is only referenced from mc attribute values
+    (unpacked / "word/document.xml").write_text(
+        f"""\
+<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NS}" xmlns:mc="{MC_NS}" mc:Ignorable="w14 wp14">
+  <w:body>
+    <w:p>
+      <w:r>
+        <mc:AlternateContent xmlns:w14="{W14_NS}" xmlns:wp14="{WP14_NS}">
+          <mc:Choice Requires="wp14"><w:t>Choice</w:t></mc:Choice>
+          <mc:Fallback><w:t>Fallback</w:t></mc:Fallback>
+        </mc:AlternateContent>
+      </w:r>
+    </w:p>
+    <w:p>
+      <w:r>
+        <w:t>Anchor</w:t>
+      </w:r>
+    </w:p>
+    <w:sectPr/>
+  </w:body>
+</w:document>
+""",
+        encoding="utf-8",
+    )
+
+    def insert_paragraph(doc):
+        editor = doc["word/document.xml"]
+        anchor = editor.get_node(tag="w:p", contains="Anchor")
+        editor.insert_after(anchor, "<w:p><w:r><w:t>New</w:t></w:r></w:p>")
+
+    assert_same_parts(unpacked, tmp_path / "parity", insert_paragraph)
+
+    doc = open_document(unpacked, tmp_path, "lxml")
+    insert_paragraph(doc)
+    doc.save(validate=False)
+    root = lxml.etree.parse(str(doc.original_path / "word/document.xml")).getroot()
+    assert root.nsmap["w14"] == W14_NS
+    alternate_content = root.find(f".//{{{MC_NS}}}AlternateContent")
+    assert alternate_content.nsmap["wp14"] == WP14_NS
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_batch_keeps_helper_results_and_order(unpacked, tmp_path, engine):
+    results = {}
+    for name, operation in [
+        ("plain", edits_with_helpers),
+        ("batched", batched_edits_with_helpers),
+    ]:
+        doc = open_document(unpacked, tmp_path / name, engine)
+        returned = operation(doc)
+        results[name] = (returned, saved_parts(doc))
+    assert results["batched"][0] == ["w:del", "w:ins"]
+    assert results["batched"] == results["plain"]
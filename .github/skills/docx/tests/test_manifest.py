@@ -0,0 +1,101 @@
+"""
+Tests for the unpack manifest that pack.py uses to find parts left in the archive.
+"""
+
+import zipfile
+
+import pytest
+
+from ooxml.scripts.pack import MANIFEST_NAME, find_changed_parts, pack_document
+from ooxml.scripts.unpack import unpack_document
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+ENTRIES = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" '
+        f'Type="{REL_NS}/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" '
+        f'Type="{REL_NS}/image" Target="media/image1.png"/>'
+        '<Relationship Id="rId2" '
+        f'Type="{REL_NS}/hyperlink" Target="https://example.com" '
+        'TargetMode="External"/></Relationships>'
+    ),
+    "word/document.xml": (
+        f'<w:document xmlns:w="{W_NS}"><w:body><w:p><w:r><w:t>Text</w:t>'
+        "</w:r></w:p></w:body></w:document>"
+    ),
+    "word/media/image1.png": b"\x89PNG not really",
+}
+
+
+@pytest.fixture
+def docx_file(tmp_path):
+    """Write a small .docx with one media part and return its path."""
+    path = tmp_path / "source.docx"
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in ENTRIES.items():
+            zf.writestr(name, content)
+    return path
+
+
+def read_entries(path):
+    with zipfile.ZipFile(path) as zf:
+        return {name: zf.read(name) for name in zf.namelist()}
+
+
+def test_manifest_is_inside_the_directory_and_not_packed(docx_file, tmp_path):
+    unpacked = tmp_path / "unpacked"
+    unpack_document(docx_file, unpacked)
+    assert (unpacked / MANIFEST_NAME).is_file()
+    assert find_changed_parts(unpacked) == set()
+
+    pack_document(unpacked, tmp_path / "packed.docx")
+    assert sorted(read_entries(tmp_path / "packed.docx")) == sorted(ENTRIES)
+
+
+def test_parts_left_in_the_archive_are_packed_from_the_original(docx_file, tmp_path):
+    unpacked = tmp_path / "unpacked"
+    unpack_document(docx_file, unpacked, xml_only=True)
+    assert not (unpacked / "word/media/image1.png").exists()
+
+    # The manifest moves with the directory
+    moved = unpacked.rename(tmp_path / "moved")
+    pack_document(moved, tmp_path / "packed.docx")
+    packed = read_entries(tmp_path / "packed.docx")
+    assert packed["word/media/image1.png"] == ENTRIES["word/media/image1.png"]
+
+
+def test_missing_manifest_with_missing_parts_warns(docx_file, tmp_path, capsys):
+    unpacked = tmp_path / "unpacked"
+    unpack_document(docx_file, unpacked, xml_only=True)
+    (unpacked / MANIFEST_NAME).unlink()
+
+    # Packed as before, without the parts that were left in the archive
+    assert pack_document(unpacked, tmp_path / "packed.docx")
+    assert "word/media/image1.png" in capsys.readouterr().err
+    assert "word/media/image1.png" not in read_entries(tmp_path / "packed.docx")
+
+
+def test_missing_manifest_is_fine_for_a_complete_directory(docx_file, tmp_path):
+    unpacked = tmp_path / "unpacked"
+    unpack_document(docx_file, unpacked)
+    (unpacked / MANIFEST_NAME).unlink()
+
+    assert pack_document(unpacked, tmp_path / "packed.docx")
+    assert sorted(read_entries(tmp_path / "packed.docx")) == sorted(ENTRIES)
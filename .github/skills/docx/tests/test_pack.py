@@ -0,0 +1,91 @@
+"""
+Tests for writing and copying archive entries in pack.py.
+"""
+
+import struct
+import zipfile
+
+import pytest
+
+from ooxml.scripts import pack
+from ooxml.scripts.pack import copy_zip_entry, write_part
+
+
+def test_streamed_part_over_the_zip64_limit(tmp_path, monkeypatch):
+    # Lower the limit rather than write gigabytes
+    monkeypatch.setattr(zipfile, "ZIP64_LIMIT", 1000)
+    part = tmp_path / "oleObject1.bin"
+    part.write_bytes(bytes(range(256)) * 20)
+
+    archive = tmp_path / "packed.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        write_part(zf, part, "word/embeddings/oleObject1.bin")
+
+    with zipfile.ZipFile(archive) as zf:
+        assert zf.testzip() is None
+        assert zf.read("word/embeddings/oleObject1.bin") == part.read_bytes()
+
+
+def write_source_archive(path):
+    """Write an archive with a deflated, a stored, and a zip64 member."""
+    members = {}
+    with zipfile.ZipFile(path, "w") as zf:
+        info = zipfile.ZipInfo("word/document.xml", date_time=(2024, 1, 2, 3, 4, 6))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        # Extended timestamp field, which copies must keep
+        info.extra = b"UT\x05\x00\x01\x00\x00\x00\x00"
+        members[info.filename] = b"<w:document>" + b"<w:p/>" * 500 + b"</w:document>"
+        zf.writestr(info, members[info.filename])
+
+        info = zipfile.ZipInfo("word/media/image1.png", date_time=(2024, 1, 2, 3, 4, 6))
+        members[info.filename] = bytes(range(256)) * 2
+        zf.writestr(info, members[info.filename])
+
+        info = zipfile.ZipInfo("word/embeddings/oleObject1.bin")
+        info.compress_type = zipfile.ZIP_DEFLATED
+        members[info.filename] = bytes(range(256)) * 40
+        with zf.open(info, "w", force_zip64=True) as f:
+            f.write(members[info.filename])
+    return members
+
+
+def raw_member(path, info):
+    """Return the compressed bytes of a member as stored in the archive."""
+    with open(path, "rb") as f:
+        f.seek(info.header_offset + 26)
+        name_length, extra_length = struct.unpack("<HH", f.read(4))
+        f.seek(name_length + extra_length, 1)
+        return f.read(info.compress_size)
+
+
+@pytest.mark.parametrize("zip64_limit", [zipfile.ZIP64_LIMIT, 5000])
+@pytest.mark.parametrize("raw_copy", [True, False], ids=["raw", "recompressed"])
+def test_copied_entries_round_trip(tmp_path, monkeypatch, zip64_limit, raw_copy):
+    # With the lower limit the large member needs zip64 records in the copy too
+    monkeypatch.setattr(zipfile, "ZIP64_LIMIT", zip64_limit)
+    if not raw_copy:
+        # As if zipfile lacked the internals used for raw copies
+        monkeypatch.setattr(pack, "_RAW_COPY_ATTRIBUTES", ("no_such_attribute",))
+    source = tmp_path / "source.zip"
+    members = write_source_archive(source)
+
+    target = tmp_path / "target.zip"
+    with zipfile.ZipFile(source) as source_zip:
+        with zipfile.ZipFile(target, "w") as target_zip:
+            for info in source_zip.infolist():
+                copy_zip_entry(source_zip, info, target_zip)
+
+    with zipfile.ZipFile(source) as source_zip, zipfile.ZipFile(target) as target_zip:
+        assert target_zip.testzip() is None
+        for name, content in members.items():
+            source_info = source_zip.getinfo(name)
+            target_info = target_zip.getinfo(name)
+            assert target_zip.read(name) == content
+            assert raw_member(target, target_info) == raw_member(source, source_info)
+            for field in ("CRC", "compress_type", "date_time", "file_size"):
+                assert getattr(target_info, field) == getattr(source_info, field)
+        extra = target_zip.getinfo("word/document.xml").extra
+        assert extra.startswith(b"UT\x05\x00")
+        zip64_member = target_zip.getinfo("word/embeddings/oleObject1.bin")
+        has_zip64_record = zip64_member.extra[:2] == b"\x01\x00"
+        assert has_zip64_record == (zip64_member.file_size > zip64_limit)
@@ -0,0 +1,85 @@
+"""
+Tests for unpack.py --incremental, which unpacks a new revision over an old one.
+"""
+
+import json
+import zipfile
+
+from ooxml.scripts.pack import MANIFEST_NAME
+from ooxml.scripts.unpack import unpack_document
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def document_xml(text):
+    return (
+        f'<w:document xmlns:w="{W_NS}"><w:body><w:p><w:r><w:t>{text}</w:t>'
+        "</w:r></w:p></w:body></w:document>"
+    )
+
+
+FIRST_REVISION = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="xml" ContentType="application/xml"/></Types>'
+    ),
+    "word/document.xml": document_xml("First"),
+    "word/styles.xml": f'<w:styles xmlns:w="{W_NS}"/>',
+    "word/footer1.xml": f'<w:ftr xmlns:w="{W_NS}"/>',
+    "word/media/image1.png": b"\x89PNG not really",
+}
+
+# The document changes and the footer goes; everything else stays the same
+SECOND_REVISION = {
+    name: content
+    for name, content in FIRST_REVISION.items()
+    if name != "word/footer1.xml"
+}
+SECOND_REVISION["word/document.xml"] = document_xml("Second")
+
+
+def write_docx(path, entries):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return path
+
+
+def test_incremental_unpack_keeps_rewrites_and_removes_parts(tmp_path):
+    unpacked = tmp_path / "unpacked"
+    unpack_document(write_docx(tmp_path / "first.docx", FIRST_REVISION), unpacked)
+    before = {
+        name: (unpacked / name).stat().st_mtime_ns
+        for name in ("word/styles.xml", "word/media/image1.png")
+    }
+
+    second = write_docx(tmp_path / "second.docx", SECOND_REVISION)
+    unpack_document(second, unpacked, incremental=True)
+
+    for name, mtime_ns in before.items():
+        assert (unpacked / name).stat().st_mtime_ns == mtime_ns, name
+    assert "Second" in (unpacked / "word/document.xml").read_text()
+    assert not (unpacked / "word/footer1.xml").exists()
+    manifest = json.loads((unpacked / MANIFEST_NAME).read_text())
+    assert sorted(manifest["parts"]) == sorted(SECOND_REVISION)
+
+
+def test_incremental_unpack_only_removes_files_inside_the_directory(tmp_path):
+    unpacked = tmp_path / "unpacked"
+    unpack_document(write_docx(tmp_path / "first.docx", FIRST_REVISION), unpacked)
+    outside = tmp_path / "outside.txt"
+    outside.write_text("keep me")
+
+    # A manifest that names files outside the directory, e.g. edited by hand
+    manifest_file = unpacked / MANIFEST_NAME
+    manifest = json.loads(manifest_file.read_text())
+    record = manifest["parts"]["word/styles.xml"]
+    manifest["parts"]["../outside.txt"] = record
+    manifest["parts"][str(outside)] = record
+    manifest_file.write_text(json.dumps(manifest))
+
+    second = write_docx(tmp_path / "second.docx", SECOND_REVISION)
+    unpack_document(second, unpacked, incremental=True)
+
+    assert outside.read_text() == "keep me"
+    assert not (unpacked / "word/footer1.xml").exists()
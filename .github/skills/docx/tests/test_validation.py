@@ -0,0 +1,120 @@
+"""
+Tests for the schema validators' changed-only and cached cross-file checks.
+"""
+
+import collections
+import zipfile
+
+import pytest
+
+from ooxml.scripts.validation import DOCXSchemaValidator
+from ooxml.scripts.validation import base
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/styles.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PACKAGE_REL_NS}"><Relationship Id="rId1" '
+        f'Type="{REL_NS}/officeDocument" Target="word/document.xml"/>'
+        "</Relationships>"
+    ),
+    "word/_rels/document.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PACKAGE_REL_NS}"><Relationship Id="rId1" '
+        f'Type="{REL_NS}/styles" Target="styles.xml"/></Relationships>'
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NS}"><w:body><w:p><w:r><w:t>Text</w:t></w:r>'
+        "</w:p><w:sectPr/></w:body></w:document>"
+    ),
+    "word/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:styles xmlns:w="{W_NS}"/>'
+    ),
+}
+
+
+@pytest.fixture
+def package(tmp_path):
+    """Write the test document as a .docx and unpacked; return both paths."""
+    original = tmp_path / "original.docx"
+    with zipfile.ZipFile(original, "w") as zf:
+        for name, content in PARTS.items():
+            zf.writestr(name, content)
+    unpacked = tmp_path / "unpacked"
+    for name, content in PARTS.items():
+        path = unpacked / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return unpacked, original
+
+
+def test_changed_only_references_use_summaries(package, monkeypatch, capsys):
+    unpacked, original = package
+    validator = DOCXSchemaValidator(unpacked, original)
+    assert validator.validate_file_references()
+
+    # The unchanged .rels file now points to a missing part
+    (unpacked / "word/styles.xml").unlink()
+    validator = DOCXSchemaValidator(
+        unpacked, original, changed_parts={"word/document.xml"}
+    )
+    parsed = []
+    parse_xml = validator._parse_xml
+
+    def record_parse(xml_file):
+        parsed.append(xml_file)
+        return parse_xml(xml_file)
+
+    monkeypatch.setattr(validator, "_parse_xml", record_parse)
+    assert not validator.validate_file_references()
+    assert "Broken reference to styles.xml" in capsys.readouterr().out
+    assert not [f for f in parsed if f.name.endswith(".rels")]
+
+
+def test_summary_cache_is_bounded(package, monkeypatch):
+    unpacked, original = package
+    monkeypatch.setattr(base, "SUMMARY_CACHE_SIZE", 2)
+    monkeypatch.setattr(base, "_summary_cache", collections.OrderedDict())
+    validator = DOCXSchemaValidator(unpacked, original)
+    assert validator.validate_file_references()
+    assert validator.validate_unique_ids()
+    assert len(base._summary_cache) == 2
+
+
+def test_parallel_xsd_validation_reports_the_same_errors(package, capsys):
+    unpacked, original = package
+    # Elements the schemas do not allow, in two parts
+    document = unpacked / "word/document.xml"
+    document.write_text(document.read_text().replace("<w:sectPr/>", "<w:bogus/>"))
+    styles = unpacked / "word/styles.xml"
+    styles.write_text(styles.read_text().replace("/>", "><w:bogusStyle/></w:styles>"))
+
+    reports = {}
+    for workers in (1, 2):
+        validator = DOCXSchemaValidator(unpacked, original, workers=workers)
+        try:
+            assert not validator.validate_against_xsd()
+        finally:
+            validator.close()
+        reports[workers] = capsys.readouterr().out
+    assert reports[1] == reports[2]
+    assert "word/document.xml: 1 new error(s)" in reports[1]
+    assert "word/styles.xml: 1 new error(s)" in reports[1]
+    assert "bogus" in reports[1]